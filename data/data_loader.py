@@ -5,12 +5,15 @@ Handles loading and parsing of drone log files
 
 import os
 import json
+import logging
 import re
 from datetime import datetime, timedelta
 from collections import defaultdict
 import pandas as pd
 from typing import Dict, List, Optional, Tuple
 
+logger = logging.getLogger(__name__)
+
 class LogFileConfig:
     """Configuration for different log file types"""
     
@@ -50,6 +53,8 @@ class DataLoader:
     
     def __init__(self):
         self.session_pattern = r'\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2}'
+        # Table key -> (min, max) timestamp of the last loaded session, computed once at load
+        self.time_bounds: Dict[str, Tuple[Optional[datetime], Optional[datetime]]] = {}
     
     def find_sessions(self, folder_path: str) -> Dict[str, str]:
         """Find all valid session folders"""
@@ -87,6 +92,8 @@ class DataLoader:
         # Also scan for unknown log files
         self._scan_unknown_files(session_path, data_categories)
         
+        self.time_bounds = {key: DataFilter.get_time_range(df) for key, df in data_categories.items()}
+        
         return data_categories
     
     def _scan_unknown_files(self, session_path: str, data_categories: Dict[str, pd.DataFrame]) -> None:
@@ -166,7 +173,7 @@ class DataLoader:
             # Clean and validate data types
             df = self._clean_dataframe(df)
             
-            # Sort by timestamp
+            # Sort by timestamp once, so later range queries can rely on order
             if 'timestamp' in df.columns:
                 df = df.sort_values('timestamp').reset_index(drop=True)
             
@@ -311,8 +318,14 @@ class DataFilter:
             if not pd.api.types.is_datetime64_any_dtype(df['timestamp']):
                 df['timestamp'] = pd.to_datetime(df['timestamp'])
             
-            min_time = df['timestamp'].min()
-            max_time = df['timestamp'].max()
+            timestamps = df['timestamp']
+            if timestamps.is_monotonic_increasing:
+                # DataLoader sorts its tables (and filtered slices stay sorted),
+                # so the bounds are just the first and last rows
+                min_time, max_time = timestamps.iloc[0], timestamps.iloc[-1]
+            else:
+                min_time = timestamps.min()
+                max_time = timestamps.max()
             
             # Convert to Python datetime if they are pandas Timestamps
             if pd.isna(min_time) or pd.isna(max_time):
@@ -339,8 +352,20 @@ class DataFilter:
             return None, None
     
     @staticmethod
-    def get_session_time_range(session_name: str, session_data: Dict[str, pd.DataFrame]) -> Tuple[Optional[datetime], Optional[datetime]]:
-        """Get time range for a session using folder name as start and last log timestamp as end"""
+    def get_session_time_range(session_name: str, session_data: Dict[str, pd.DataFrame],
+                               time_bounds: Optional[Dict[str, Tuple[Optional[datetime], Optional[datetime]]]] = None
+                               ) -> Tuple[Optional[datetime], Optional[datetime]]:
+        """Get time range for a session using folder name as start and last log timestamp as end
+        
+        `time_bounds` (DataLoader.time_bounds) supplies precomputed per-table bounds;
+        tables missing from it are scanned.
+        """
+        time_bounds = time_bounds or {}
+        
+        def table_range(category_file, df):
+            bounds = time_bounds.get(category_file)
+            return bounds if bounds is not None else DataFilter.get_time_range(df)
+        
         try:
             # Extract start time from session folder name (format: yyyy-mm-dd_hh-mm-ss)
             session_start = datetime.strptime(session_name, "%Y-%m-%d_%H-%M-%S")
@@ -353,23 +378,17 @@ class DataFilter:
                     continue
                 
                 # Get the last timestamp from this file
-                df_max = df['timestamp'].max()
-                
-                # Convert to python datetime
-                if hasattr(df_max, 'to_pydatetime'):
-                    try:
-                        df_max = df_max.to_pydatetime()
-                    except ValueError:
-                        df_max = pd.to_datetime(df_max).replace(microsecond=df_max.microsecond)
+                _, df_max = table_range(category_file, df)
+                if df_max is None:
+                    continue
                 
                 if max_timestamp is None or df_max > max_timestamp:
                     max_timestamp = df_max
             
             if max_timestamp:
-                print(f"Session: {session_name}")
-                print(f"Start time (from folder): {session_start}")
-                print(f"End time (from logs): {max_timestamp}")
-                print(f"Duration: {max_timestamp - session_start}")
+                logger.debug("Session %s: start %s (from folder), end %s (from logs), duration %s",
+                             session_name, session_start, max_timestamp,
+                             max_timestamp - session_start)
                 
                 return session_start, max_timestamp
             else:
@@ -383,11 +402,11 @@ class DataFilter:
             min_time = None
             max_time = None
             
-            for df in session_data.values():
+            for category_file, df in session_data.items():
                 if df.empty or 'timestamp' not in df.columns:
                     continue
                 
-                df_min, df_max = DataFilter.get_time_range(df)
+                df_min, df_max = table_range(category_file, df)
                 if df_min and df_max:
                     if min_time is None or df_min < min_time:
                         min_time = df_min
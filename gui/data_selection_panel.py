@@ -43,6 +43,7 @@ class DataSelectionPanel(ttk.Frame):
         # Plot option variables
         self.separate_plots_var = tk.BooleanVar(value=False)
         self.show_grid_var = tk.BooleanVar(value=True)
+        self.high_fidelity_var = tk.BooleanVar(value=False)
         
         # GUI components - initialize properly
         self.canvas = None
@@ -226,6 +227,24 @@ class DataSelectionPanel(ttk.Frame):
                                relief='flat',
                                borderwidth=0)
         grid_cb.pack(anchor=tk.W)
+        
+        # High-fidelity option (less aggressive line simplification)
+        fidelity_frame = tk.Frame(options_frame, bg=self.COLORS['bg_secondary'])
+        fidelity_frame.pack(fill=tk.X, pady=(8, 0))
+        
+        fidelity_cb = tk.Checkbutton(fidelity_frame,
+                                   text="High-fidelity lines",
+                                   variable=self.high_fidelity_var,
+                                   command=self._on_plot_option_change,
+                                   bg=self.COLORS['bg_secondary'],
+                                   fg=self.COLORS['text_primary'],
+                                   font=('Segoe UI', 9),
+                                   activebackground=self.COLORS['bg_secondary'],
+                                   activeforeground=self.COLORS['text_primary'],
+                                   selectcolor=self.COLORS['accent'],
+                                   relief='flat',
+                                   borderwidth=0)
+        fidelity_cb.pack(anchor=tk.W)
     
     def update_data_categories(self, data_categories: Dict[str, pd.DataFrame]):
         """Update data categories and create modern checkboxes"""
@@ -459,6 +478,10 @@ class DataSelectionPanel(ttk.Frame):
         """Get show grid option"""
         return self.show_grid_var.get()
     
+    def get_high_fidelity_option(self) -> bool:
+        """Get high-fidelity (minimal line simplification) option"""
+        return self.high_fidelity_var.get()
+    
     def select_all_data(self):
         """Select all data series"""
         for var in self.selection_vars.values():
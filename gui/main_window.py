@@ -6,9 +6,9 @@ Contains the main application window and user interface
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from datetime import datetime
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
-from matplotlib.figure import Figure
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pandas as pd
 import os
 import sys
 
@@ -16,7 +16,6 @@ import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from data.data_loader import DataLoader, DataFilter
-from plotting.plot_manager import PlotManager
 from gui.data_selection_panel import DataSelectionPanel
 from gui.time_range_selector import TimeRangeSelector
 
@@ -39,6 +38,14 @@ class DroneLogAnalyzer:
         'error': '#ef4444'
     }
 
+    # File types offered by the export dialog
+    EXPORT_FILETYPES = (
+        ("PNG files", "*.png"),
+        ("PDF files", "*.pdf"),
+        ("SVG files", "*.svg"),
+        ("JPEG files", "*.jpg")
+    )
+
     def __init__(self, root):
         self.root = root
 
@@ -54,6 +61,25 @@ class DroneLogAnalyzer:
         self.current_session = None
         self.session_data = {}
         self.selected_data_vars = {}
+        # data_key -> (category_file, column, label), split once per session
+        self._data_key_info = {}
+        # Checked data keys, refreshed only when a checkbox changes
+        self._selected_keys = []
+        # category_file -> sorted int64 ns timestamps (None if unsorted)
+        self._time_index = {}
+
+        # Background filtering: one worker; the Tk thread polls for its result
+        # (tkinter must not be called from the worker)
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._pending_future = None
+        self._poll_interval_ms = 10
+        # Options the current plot was built with; same options and series
+        # (e.g. only the time window moved) reuse the existing lines
+        self._plot_options = None
+        # (hour, minute, second) / whole seconds last shown in the time labels
+        self._shown_start_hms = None
+        self._shown_end_hms = None
+        self._shown_duration_s = None
 
         # Initialize control variables
         self.folder_var = tk.StringVar()
@@ -68,11 +94,14 @@ class DroneLogAnalyzer:
 
         # GUI components
         self.data_panel = None
+        self.figure = None
         self.plot_manager = None
         self.canvas = None
         self.time_selector = None
         self.session_combo = None
         self.folder_entry = None
+        self._stats_window = None
+        self._stats_text = None
 
         # Proxy for any existing code that expects control_panel
         class ControlPanelProxy:
@@ -108,6 +137,7 @@ class DroneLogAnalyzer:
 
         # Build the GUI
         self.create_gui()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
 
         # If a default folder “drone_logs” exists, try loading it
         if os.path.exists("drone_logs"):
@@ -233,7 +263,6 @@ class DroneLogAnalyzer:
 
 
         self.root.update_idletasks()
-        self.canvas.draw()
 
 
     def create_top_control_bar(self, parent):
@@ -363,138 +392,6 @@ class DroneLogAnalyzer:
         # Tooltips (no change needed—just keep them)
 
 
-    def create_compact_time_controls(self, parent):
-        """Create a slimmer time‐controls block (right side of top bar)"""
-        # 1) Header: shrink vertical padding
-        header_frame = tk.Frame(parent, bg=self.COLORS['bg_primary'])
-        header_frame.pack(fill=tk.X, pady=(0, 5))  # was pady=(0,10)
-
-        tk.Label(
-            header_frame,
-            text="⏱️ Time Range",
-            bg=self.COLORS['bg_primary'],
-            fg=self.COLORS['text_primary'],
-            font=('Segoe UI', 10, 'bold')  # was 11→10
-        ).pack(side=tk.LEFT)
-
-        # 2) Time display row: reduce vertical padding around labels
-        time_display_frame = tk.Frame(parent, bg=self.COLORS['bg_primary'])
-        time_display_frame.pack(fill=tk.X, pady=(0, 5))  # was (0,8)
-
-        # Start
-        start_frame = tk.Frame(time_display_frame, bg=self.COLORS['bg_primary'])
-        start_frame.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        tk.Label(
-            start_frame,
-            text="Start:",
-            bg=self.COLORS['bg_primary'],
-            fg=self.COLORS['text_secondary'],
-            font=('Segoe UI', 7)  # was 8→7
-        ).pack(anchor=tk.W)
-        self.start_time_var = tk.StringVar(value="--:--:--")
-        tk.Label(
-            start_frame,
-            textvariable=self.start_time_var,
-            bg=self.COLORS['bg_primary'],
-            fg=self.COLORS['accent'],
-            font=('Segoe UI', 9, 'bold')  # was 10→9
-        ).pack(anchor=tk.W)
-
-        # Duration
-        duration_frame = tk.Frame(time_display_frame, bg=self.COLORS['bg_primary'])
-        duration_frame.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=20)
-        tk.Label(
-            duration_frame,
-            text="Duration:",
-            bg=self.COLORS['bg_primary'],
-            fg=self.COLORS['text_secondary'],
-            font=('Segoe UI', 7)  # was 8→7
-        ).pack()
-        self.duration_var = tk.StringVar(value="--")
-        tk.Label(
-            duration_frame,
-            textvariable=self.duration_var,
-            bg=self.COLORS['bg_primary'],
-            fg=self.COLORS['warning'],
-            font=('Segoe UI', 9, 'bold')  # was 10→9
-        ).pack()
-
-        # End
-        end_frame = tk.Frame(time_display_frame, bg=self.COLORS['bg_primary'])
-        end_frame.pack(side=tk.RIGHT, fill=tk.X, expand=True)
-        tk.Label(
-            end_frame,
-            text="End:",
-            bg=self.COLORS['bg_primary'],
-            fg=self.COLORS['text_secondary'],
-            font=('Segoe UI', 7)  # was 8→7
-        ).pack(anchor=tk.E)
-        self.end_time_var = tk.StringVar(value="--:--:--")
-        tk.Label(
-            end_frame,
-            textvariable=self.end_time_var,
-            bg=self.COLORS['bg_primary'],
-            fg=self.COLORS['accent'],
-            font=('Segoe UI', 9, 'bold')  # was 10→9
-        ).pack(anchor=tk.E)
-
-        # ── Integrate TimeRangeSelector (slider) ──────────────────────────
-        self.time_selector = TimeRangeSelector(
-            parent,
-            on_range_change=self._on_time_range_changed
-        )
-        # Keep the slider_height bump (60) so labels above don’t get clipped:
-        self.time_selector.slider_height = 60
-        self.time_selector.pack(fill=tk.X, pady=(0, 0))  # was no change
-
-        # ── “Step (s)” Entry under the slider ───────────────────────────────
-        split_frame = tk.Frame(parent, bg=self.COLORS['bg_primary'])
-        split_frame.pack(fill=tk.X, pady=(5, 0))  # minimal vertical gap
-
-        tk.Label(
-            split_frame,
-            text="Step (s):",
-            bg=self.COLORS['bg_primary'],
-            fg=self.COLORS['text_secondary'],
-            font=('Segoe UI', 7)  # was 8→7
-        ).pack(side=tk.LEFT, padx=(10, 5))
-
-        self.time_split_var = tk.StringVar(value="1")
-        split_entry = tk.Entry(
-            split_frame,
-            textvariable=self.time_split_var,
-            width=4,
-            font=('Segoe UI', 9),
-            relief='solid',
-            bd=1,
-            highlightbackground=self.COLORS['border'],
-            highlightthickness=1
-        )
-        split_entry.pack(side=tk.LEFT)
-
-        def on_split_enter(event=None):
-            raw = self.time_split_var.get().strip()
-            try:
-                secs = int(raw)
-                if secs <= 0:
-                    raise ValueError
-                if hasattr(self.time_selector, 'set_step'):
-                    self.time_selector.set_step(secs)
-                    self.status_var.set(f"Time‐split set to {secs} s")
-                else:
-                    messagebox.showwarning(
-                        "Unsupported",
-                        "This TimeRangeSelector version cannot change step dynamically."
-                    )
-            except ValueError:
-                messagebox.showerror(
-                    "Invalid Input",
-                    "Please enter a positive integer for seconds."
-                )
-
-        split_entry.bind('<Return>', on_split_enter)
-        split_entry.bind('<FocusOut>', on_split_enter)
-
     def browse_folder(self):
         """Handle folder browse button click"""
         folder = filedialog.askdirectory(
@@ -664,22 +561,53 @@ class DroneLogAnalyzer:
             font=('Segoe UI', 12, 'bold')
         ).pack(side=tk.LEFT, pady=12)
 
-        # Create a Figure with a small default size
+        # Canvas container
+        self._canvas_container = tk.Frame(parent, bg=self.COLORS['bg_primary'])
+        self._canvas_container.pack(fill=tk.BOTH, expand=True, padx=15, pady=(5, 15))
+
+        # The Figure, its canvas and the PlotManager are built by _ensure_figure()
+        # on first use; until then this placeholder keeps matplotlib off startup
+        self._plot_placeholder = tk.Label(
+            self._canvas_container,
+            text="Select data series to visualize",
+            bg=self.COLORS['bg_primary'],
+            fg=self.COLORS['text_secondary'],
+            font=('Segoe UI', 10)
+        )
+        self._plot_placeholder.pack(fill=tk.BOTH, expand=True)
+
+        # Compact toolbar
+        self._toolbar_frame = tk.Frame(self._canvas_container, bg=self.COLORS['bg_tertiary'], height=40)
+        self._toolbar_frame.pack(fill=tk.X, pady=(8, 0))
+        self._toolbar_frame.pack_propagate(False)
+
+        self._custom_toolbar_frame = self.add_custom_toolbar_buttons(self._toolbar_frame)
+
+    def _ensure_figure(self):
+        """Create the matplotlib Figure, Tk canvas, toolbar and PlotManager on first use"""
+        if self.figure is not None:
+            return
+
+        # Imported here so launching the GUI does not pay for matplotlib
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+        from plotting.plot_manager import PlotManager
+
+        # Create a Figure with a small default size; constrained layout
+        # re-solves spacing incrementally, so no per-redraw tight_layout()
         self.figure = Figure(
             figsize=(2, 2), dpi=100,  # small default
+            layout='constrained',
             facecolor=self.COLORS['bg_primary'],
             edgecolor=self.COLORS['border']
         )
         self.plot_manager = PlotManager(self.figure)
 
-        # Canvas container
-        canvas_container = tk.Frame(parent, bg=self.COLORS['bg_primary'])
-        canvas_container.pack(fill=tk.BOTH, expand=True, padx=15, pady=(5, 15))
-
-        # Embed the Figure in a Tkinter widget
-        self.canvas = FigureCanvasTkAgg(self.figure, master=canvas_container)
+        # Embed the Figure in a Tkinter widget where the placeholder was
+        self._plot_placeholder.destroy()
+        self.canvas = FigureCanvasTkAgg(self.figure, master=self._canvas_container)
         widget = self.canvas.get_tk_widget()
-        widget.pack(fill=tk.BOTH, expand=True)
+        widget.pack(fill=tk.BOTH, expand=True, before=self._toolbar_frame)
 
         # ─── Add this block to force a “real‐size” redraw once the canvas is first shown ─────────
         def _on_first_map(event):
@@ -689,17 +617,10 @@ class DroneLogAnalyzer:
         widget.bind("<Map>", _on_first_map)
         # ──────────────────────────────────────────────────────────────────────────────────────────
 
-        # Compact toolbar
-        toolbar_frame = tk.Frame(canvas_container, bg=self.COLORS['bg_tertiary'], height=40)
-        toolbar_frame.pack(fill=tk.X, pady=(8, 0))
-        toolbar_frame.pack_propagate(False)
-
-        toolbar = NavigationToolbar2Tk(self.canvas, toolbar_frame)
-        toolbar.update()
-        self.add_custom_toolbar_buttons(toolbar_frame)
-
-
-
+        # Same packing order as if the toolbar had been created before the custom buttons
+        self.toolbar = NavigationToolbar2Tk(self.canvas, self._toolbar_frame, pack_toolbar=False)
+        self.toolbar.pack(side=tk.BOTTOM, fill=tk.X, before=self._custom_toolbar_frame)
+        self.toolbar.update()
 
     def add_custom_toolbar_buttons(self, toolbar_frame):
         """Add modern custom buttons to toolbar"""
@@ -748,6 +669,8 @@ class DroneLogAnalyzer:
         stats_btn.bind('<Enter>', on_enter(stats_btn, self.COLORS['bg_tertiary']))
         stats_btn.bind('<Leave>', on_leave(stats_btn, self.COLORS['bg_primary']))
 
+        return custom_frame
+
     def create_status_bar(self, parent):
         """Create modern status bar"""
         self.status_frame = tk.Frame(parent, bg=self.COLORS['bg_primary'],
@@ -788,25 +711,34 @@ class DroneLogAnalyzer:
     def _on_time_range_changed(self, start_time: datetime, end_time: datetime):
         """Handle a callback from TimeRangeSelector whenever the user drags/apply/resets"""
 
-        # Update the “Start: …” and “End: …” labels
-        self.start_time_var.set(start_time.strftime("%H:%M:%S"))
-        self.end_time_var.set(end_time.strftime("%H:%M:%S"))
+        # Update the “Start: …” and “End: …” labels; they show whole seconds,
+        # so fine drags mostly leave them (and their strftime) untouched
+        start_hms = (start_time.hour, start_time.minute, start_time.second)
+        if start_hms != self._shown_start_hms:
+            self.start_time_var.set(start_time.strftime("%H:%M:%S"))
+            self._shown_start_hms = start_hms
+        end_hms = (end_time.hour, end_time.minute, end_time.second)
+        if end_hms != self._shown_end_hms:
+            self.end_time_var.set(end_time.strftime("%H:%M:%S"))
+            self._shown_end_hms = end_hms
 
         # Compute and display the duration
         duration = end_time - start_time
         total_seconds = int(duration.total_seconds())
-        hours = total_seconds // 3600
-        minutes = (total_seconds % 3600) // 60
-        seconds = total_seconds % 60
-
-        if hours > 0:
-            duration_str = f"{hours}h {minutes}m"
-        elif minutes > 0:
-            duration_str = f"{minutes}m {seconds}s"
-        else:
-            duration_str = f"{seconds}s"
+        if total_seconds != self._shown_duration_s:
+            hours = total_seconds // 3600
+            minutes = (total_seconds % 3600) // 60
+            seconds = total_seconds % 60
+
+            if hours > 0:
+                duration_str = f"{hours}h {minutes}m"
+            elif minutes > 0:
+                duration_str = f"{minutes}m {seconds}s"
+            else:
+                duration_str = f"{seconds}s"
 
-        self.duration_var.set(duration_str)
+            self.duration_var.set(duration_str)
+            self._shown_duration_s = total_seconds
 
         # Finally, re‐plot with the new time filter
         self.apply_time_filter()
@@ -905,13 +837,17 @@ class DroneLogAnalyzer:
             # Let the left panel know what data columns are available
             self.data_panel.update_data_categories(self.session_data)
             self.selected_data_vars = self.data_panel.get_selection_vars()
+            self._data_key_info = self._build_data_key_info(self.selected_data_vars)
+            self._selected_keys = []  # fresh checkboxes start unchecked
+            self._time_index = self._build_time_index(self.session_data)
 
             # Ask DataFilter for min/max timestamps in this session
             self.update_time_range_info()
 
             # Clear any old plots
-            self.plot_manager.clear_plots()
-            self.canvas.draw()
+            if self.figure is not None:
+                self.plot_manager.clear_plots()
+                self.canvas.draw_idle()
 
             # Update status bar
             data_count = sum(len(df) for df in self.session_data.values())
@@ -930,13 +866,34 @@ class DroneLogAnalyzer:
             return
 
         min_time, max_time = self.data_filter.get_session_time_range(
-            self.current_session, self.session_data
+            self.current_session, self.session_data, self.data_loader.time_bounds
         )
         if min_time and max_time:
             self.control_panel.set_time_range_hint(min_time, max_time)
 
+    def _build_data_key_info(self, data_keys):
+        """Split each 'category/file.log/column' key once into (category_file, column, label)"""
+        data_key_info = {}
+        for data_key in data_keys:
+            category_file, column = data_key.rsplit('/', 1)
+            label = f"{category_file.split('/')[-1]} - {column}"
+            data_key_info[data_key] = (category_file, column, label)
+        return data_key_info
+
+    def _build_time_index(self, session_data):
+        """Cache each table's timestamps as int64 ns so time filtering can bisect them"""
+        time_index = {}
+        for category_file, df in session_data.items():
+            if df.empty or 'timestamp' not in df.columns:
+                continue
+            ts = df['timestamp'].values.astype('datetime64[ns]').view('i8')
+            # Bisecting needs monotonic timestamps; unsorted tables fall back to masking
+            time_index[category_file] = ts if np.all(np.diff(ts) >= 0) else None
+        return time_index
+
     def on_data_selection_change(self):
         """Called when the user checks/unchecks a data‐field in the left panel"""
+        self._selected_keys = [key for key, var in self.selected_data_vars.items() if var.get()]
         self.update_plots()
 
     def apply_time_filter(self):
@@ -948,30 +905,55 @@ class DroneLogAnalyzer:
         if not self.session_data or not self.selected_data_vars:
             return {}
 
-        filtered_data = {}
         start_time, end_time = self.control_panel.get_time_filter()
+        return self._collect_filtered_data(list(self._selected_keys), start_time, end_time)
 
-        for data_key, var in self.selected_data_vars.items():
-            if not var.get():
-                continue
+    def _collect_filtered_data(self, selected_keys, start_time, end_time):
+        """Filter the session tables for `selected_keys`; touches no Tk state, so it can run on the worker
 
+        Each entry is {'timestamp': datetime64[ns] array, 'data': numeric or object
+        array, 'label': str, 'is_string': bool}, the layout PlotManager expects.
+        """
+        session_data = self.session_data
+        data_key_info = self._data_key_info
+        time_index = self._time_index
+        filtered_data = {}
+
+        start_ns = pd.Timestamp(start_time).value if start_time else None
+        end_ns = pd.Timestamp(end_time).value if end_time else None
+
+        for data_key in selected_keys:
             try:
-                category_file, column = data_key.rsplit('/', 1)
-                if category_file not in self.session_data:
+                category_file, column, label = data_key_info[data_key]
+                if category_file not in session_data:
                     continue
 
-                df = self.session_data[category_file]
+                df = session_data[category_file]
                 if df.empty or column not in df.columns:
                     continue
 
-                filtered_df = self.data_filter.filter_by_time(df, start_time, end_time)
-                if filtered_df.empty:
-                    continue
+                ts = time_index.get(category_file)
+                if ts is None:
+                    filtered_df = self.data_filter.filter_by_time(df, start_time, end_time)
+                    if filtered_df.empty:
+                        continue
+                    timestamps = filtered_df['timestamp'].values
+                    values = filtered_df[column].values
+                else:
+                    # Sorted timestamps: bisect the window and slice views, no mask or copy
+                    lo = np.searchsorted(ts, start_ns, side='left') if start_ns is not None else 0
+                    hi = np.searchsorted(ts, end_ns, side='right') if end_ns is not None else len(ts)
+                    if lo >= hi:
+                        continue
+                    timestamps = df['timestamp'].values[lo:hi]
+                    values = df[column].values[lo:hi]
 
                 filtered_data[data_key] = {
-                    'timestamp': filtered_df['timestamp'].values,
-                    'data': filtered_df[column].values,
-                    'label': f"{category_file.split('/')[-1]} - {column}"
+                    'timestamp': timestamps,
+                    'data': values,
+                    'label': label,
+                    # Classified once here so the plot paths never inspect elements
+                    'is_string': values.dtype.kind == 'O' and isinstance(values[0], str)
                 }
             except Exception as e:
                 print(f"Error processing {data_key}: {e}")
@@ -980,34 +962,78 @@ class DroneLogAnalyzer:
         return filtered_data
 
     def update_plots(self):
-        """Re‐draw matplotlib plots based on `get_filtered_data()`"""
+        """Filter the selected data on the worker thread, then re‐draw via `_apply_filtered`"""
+        # Snapshot on the main thread; the worker must not see later toggles
+        selected_keys = list(self._selected_keys)
+        start_time, end_time = self.control_panel.get_time_filter()
+
+        # A newer request supersedes one that has not started yet
+        if self._pending_future is not None and not self._pending_future.done():
+            self._pending_future.cancel()
+
+        future = self._executor.submit(self._collect_filtered_data, selected_keys, start_time, end_time)
+        self._pending_future = future
+        self.root.after(self._poll_interval_ms, self._poll_filtered, future)
+
+    def _poll_filtered(self, future):
+        """Wait (on the Tk thread) for a filtering job, then hand it to `_apply_filtered`"""
+        if future is not self._pending_future:
+            return  # superseded; the newer job has its own poll
+        if not future.done():
+            self.root.after(self._poll_interval_ms, self._poll_filtered, future)
+            return
+        self._apply_filtered(future)
+
+    def on_closing(self):
+        """Stop the filtering worker and close the window"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
+
+    def _apply_filtered(self, future):
+        """Draw the result of a filtering job (always runs on the Tk main thread)"""
+        # Drop cancelled jobs and results that a newer request has superseded
+        if future is not self._pending_future or future.cancelled():
+            return
+        self._pending_future = None
+
         try:
-            filtered_data = self.get_filtered_data()
+            filtered_data = future.result()
 
             if not filtered_data:
-                self.plot_manager.clear_plots()
-                self.canvas.draw()
+                if self.figure is not None:
+                    self.plot_manager.clear_plots()
+                    self.canvas.draw_idle()
                 self.status_var.set("No data selected for plotting")
                 return
 
+            self._ensure_figure()
+
             separate_plots = self.data_panel.get_separate_plots_option()
             show_grid = self.data_panel.get_show_grid_option()
+            high_fidelity = self.data_panel.get_high_fidelity_option()
+            plot_options = (self.current_session, separate_plots, show_grid, high_fidelity)
+
+            if plot_options != self._plot_options or not self.plot_manager.update_data(filtered_data):
+                self.plot_manager.set_high_fidelity(high_fidelity)
+                self._plot_options = plot_options
+
+                if separate_plots:
+                    self.plot_manager.create_separate_plots(
+                        filtered_data,
+                        self.current_session or "",
+                        show_grid
+                    )
+                else:
+                    self.plot_manager.create_combined_plot(
+                        filtered_data,
+                        self.current_session or "",
+                        show_grid
+                    )
 
-            if separate_plots:
-                self.plot_manager.create_separate_plots(
-                    filtered_data,
-                    self.current_session or "",
-                    show_grid
-                )
-            else:
-                self.plot_manager.create_combined_plot(
-                    filtered_data,
-                    self.current_session or "",
-                    show_grid
-                )
-
-            self.figure.tight_layout()
-            self.canvas.draw()
+            # Home/back/forward refer to the previous range; start a fresh history
+            self.toolbar.update()
+            # One idle draw for whichever path ran; Tk coalesces repeated requests
+            self.plot_manager.request_draw()
             self.status_var.set(f"Plotting {len(filtered_data)} data series")
 
         except Exception as e:
@@ -1016,24 +1042,20 @@ class DroneLogAnalyzer:
 
     def export_plot(self):
         """Export the currently drawn matplotlib figure to file"""
-        if not hasattr(self, 'figure') or not self.figure.get_axes():
+        if self.figure is None or not self.figure.get_axes():
             messagebox.showwarning("No Plot", "No plot to export")
             return
 
         filename = filedialog.asksaveasfilename(
             title="Export Plot",
             defaultextension=".png",
-            filetypes=[
-                ("PNG files", "*.png"),
-                ("PDF files", "*.pdf"),
-                ("SVG files", "*.svg"),
-                ("JPEG files", "*.jpg")
-            ]
+            filetypes=self.EXPORT_FILETYPES
         )
 
         if filename:
             try:
-                success = self.plot_manager.export_plot(filename)
+                file_format = os.path.splitext(filename)[1].lstrip('.').lower() or 'png'
+                success = self.plot_manager.export_plot(filename, format=file_format)
                 if success:
                     messagebox.showinfo("Export Successful", f"Plot exported to {filename}")
                 else:
@@ -1042,55 +1064,71 @@ class DroneLogAnalyzer:
                 messagebox.showerror("Export Error", f"Error exporting plot: {str(e)}")
 
     def show_statistics(self):
-        """Pop up a new window showing summary stats of the currently plotted data"""
+        """Show summary stats of the currently plotted data (reuses one window)"""
         filtered_data = self.get_filtered_data()
         if not filtered_data:
             messagebox.showinfo("No Data", "No data selected for statistics")
             return
 
         try:
-            stats = self.plot_manager.get_plot_statistics(filtered_data)
-
-            stats_window = tk.Toplevel(self.root)
-            stats_window.title("Data Statistics")
-            stats_window.geometry("600x500")
-            stats_window.resizable(True, True)
-            stats_window.configure(bg=self.COLORS['bg_secondary'])
-
-            # Header
-            header_frame = tk.Frame(stats_window, bg=self.COLORS['bg_primary'], height=60)
-            header_frame.pack(fill=tk.X, padx=20, pady=(20, 0))
-            header_frame.pack_propagate(False)
-            tk.Label(header_frame,
-                     text="📊 Data Statistics",
-                     bg=self.COLORS['bg_primary'],
-                     fg=self.COLORS['text_primary'],
-                     font=('Segoe UI', 14, 'bold')).pack(pady=20)
-
-            # Content
-            content_frame = tk.Frame(stats_window, bg=self.COLORS['bg_primary'])
-            content_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
-
-            text_widget = tk.Text(content_frame, wrap=tk.WORD,
-                                  font=('Consolas', 10),
-                                  bg=self.COLORS['bg_tertiary'],
-                                  fg=self.COLORS['text_primary'],
-                                  relief='flat',
-                                  borderwidth=0,
-                                  padx=20, pady=20)
-            scrollbar = ttk.Scrollbar(content_frame, orient=tk.VERTICAL, command=text_widget.yview)
-            text_widget.configure(yscrollcommand=scrollbar.set)
-
-            text_widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-            scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-
+            # Static, so the Figure/canvas are not built just for statistics
+            from plotting.plot_manager import PlotManager
+            stats = PlotManager.get_plot_statistics(filtered_data)
             stats_text = self.format_statistics(stats)
-            text_widget.insert(tk.END, stats_text)
-            text_widget.config(state=tk.DISABLED)
+
+            if self._stats_window is None or not self._stats_window.winfo_exists():
+                self._create_statistics_window()
+            else:
+                self._stats_window.deiconify()
+                self._stats_window.lift()
+
+            self._stats_text.config(state=tk.NORMAL)
+            self._stats_text.delete('1.0', tk.END)
+            self._stats_text.insert(tk.END, stats_text)
+            self._stats_text.config(state=tk.DISABLED)
 
         except Exception as e:
             messagebox.showerror("Statistics Error", f"Error generating statistics: {str(e)}")
 
+    def _create_statistics_window(self):
+        """Build the statistics Toplevel once; closing it only hides it"""
+        stats_window = tk.Toplevel(self.root)
+        stats_window.title("Data Statistics")
+        stats_window.geometry("600x500")
+        stats_window.resizable(True, True)
+        stats_window.configure(bg=self.COLORS['bg_secondary'])
+        stats_window.protocol("WM_DELETE_WINDOW", stats_window.withdraw)
+
+        # Header
+        header_frame = tk.Frame(stats_window, bg=self.COLORS['bg_primary'], height=60)
+        header_frame.pack(fill=tk.X, padx=20, pady=(20, 0))
+        header_frame.pack_propagate(False)
+        tk.Label(header_frame,
+                 text="📊 Data Statistics",
+                 bg=self.COLORS['bg_primary'],
+                 fg=self.COLORS['text_primary'],
+                 font=('Segoe UI', 14, 'bold')).pack(pady=20)
+
+        # Content
+        content_frame = tk.Frame(stats_window, bg=self.COLORS['bg_primary'])
+        content_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+
+        text_widget = tk.Text(content_frame, wrap=tk.WORD,
+                              font=('Consolas', 10),
+                              bg=self.COLORS['bg_tertiary'],
+                              fg=self.COLORS['text_primary'],
+                              relief='flat',
+                              borderwidth=0,
+                              padx=20, pady=20)
+        scrollbar = ttk.Scrollbar(content_frame, orient=tk.VERTICAL, command=text_widget.yview)
+        text_widget.configure(yscrollcommand=scrollbar.set)
+
+        text_widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self._stats_window = stats_window
+        self._stats_text = text_widget
+
     def format_statistics(self, stats):
         """Format the statistics dictionary into a multi‐line string"""
         text = f"Data Statistics for Session: {self.current_session or 'Unknown'}\n"
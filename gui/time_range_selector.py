@@ -3,11 +3,17 @@ Visual Time Range Slider Widget
 A draggable time range selector with start and end handles
 """
 
+import math
+import time
 import tkinter as tk
+import tkinter.font as tkfont
 from tkinter import ttk
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from typing import Callable, Optional, Tuple
 
+import numpy as np
+
 class TimeRangeSelector(ttk.Frame):
     """Modern visual time range slider with draggable start and end points"""
 
@@ -32,6 +38,11 @@ class TimeRangeSelector(ttk.Frame):
         'handle_shadow': '#e2e8f0'
     }
 
+    # Canvas item options, built once instead of as dict literals per create_* call
+    TRACK_BG_OPTS = {'fill': COLORS['track_bg'], 'outline': ''}
+    TRACK_SELECTED_OPTS = {'fill': COLORS['track_selected'], 'outline': ''}
+    LABEL_OPTS = {'fill': COLORS['text_secondary']}
+
     def __init__(self, parent, on_range_change: Callable = None):
         super().__init__(parent)
 
@@ -40,8 +51,10 @@ class TimeRangeSelector(ttk.Frame):
         # Time range data
         self.min_time: Optional[datetime] = None
         self.max_time: Optional[datetime] = None
-        self.current_start: Optional[datetime] = None
-        self.current_end: Optional[datetime] = None
+        # The selection is kept as float seconds from min_time; current_start /
+        # current_end only build datetimes when read
+        self._start_offset: Optional[float] = None
+        self._end_offset: Optional[float] = None
 
         # -------------------------------------------------------
         #    Slider dimensions (we bump height from 35→60)
@@ -52,18 +65,108 @@ class TimeRangeSelector(ttk.Frame):
         self.track_height = 6
         self.margin = 20
 
+        # Half-extents used on every draw/hit-test, computed once
+        self._hhalf = self.handle_size // 2
+        self._thalf = self.track_height // 2
+        # Squared hit radius of a handle, for the circular hover/click test
+        self._handle_r2 = self._hhalf ** 2
+
+        # Handle sprites (normal / being dragged), rendered in create_widgets()
+        self._handle_img: Optional[tk.PhotoImage] = None
+        self._handle_img_active: Optional[tk.PhotoImage] = None
+
         # Step in seconds (for snapping)
         self.step_seconds = 1
+        # Optional sorted offsets (seconds from min_time) that replace step snapping
+        self._snap_points: Optional[np.ndarray] = None
 
         # Dragging state
         self.dragging = None  # will be 'start' or 'end' or None
         self.start_handle_x = 0
         self.end_handle_x = 0
+        self._cursor = ''  # last cursor set on the canvas
+        self._last_motion_xy = None  # last hover position hit-tested
+        self._hover_interval_ms = 16  # hover hit-tests run at most ~60 Hz
+        self._pending_hover_xy = None  # latest hover position not yet tested
+
+        # Geometry/duration cache, refreshed by _update_geometry() on resize or new range
+        self._canvas_width = self.slider_width
+        self._canvas_height = self.slider_height
+        self._track_y = self.slider_height // 2
+        self._track_y0 = self._track_y - self._thalf
+        self._track_y1 = self._track_y + self._thalf
+        self._label_y = self._track_y + 25
+        # Track background and labels only move when the geometry changes
+        self._static_dirty = True
+        self._track_width = self.slider_width - 2 * self.margin
+        self._total_duration_s = 0.0
+        self._secs_per_pixel = 0.0
+        self._pixels_per_sec = 0.0
+
+        # Canvas item ids, created once by _build_items() and moved on later draws
+        self._item_ids = {}
+        self._built = False
+        self._placeholder_id = None
+        # Min/max label strings, formatted once per set_time_range(); the
+        # shown text and selected-bar visibility are tracked to skip no-op itemconfigs
+        self._min_label = ''
+        self._max_label = ''
+        self._shown_labels: Optional[Tuple[str, str]] = None
+        self._selected_visible = True
+
+        # Programmatic changes are redrawn once, on the next idle cycle
+        self._redraw_pending = False
+
+        # Motion events only record the latest x; it is processed once per idle cycle
+        self._pending_motion_x: Optional[int] = None
+        # Latest <Configure> size, applied once per idle cycle
+        self._pending_size: Optional[Tuple[int, int]] = None
+
+        # on_range_change is rate-limited while dragging (~30 Hz); mouse-up always delivers
+        self._cb_interval_ms = 33
+        self._last_cb_ms = 0.0
+        self._last_cb_range = None
+        self._cb_after_id = None
+        # A callback slower than this stops mid-drag updates until mouse-up
+        self._defer_threshold_s = 1 / 60
+        self._defer_during_drag = False
+
+        # batch_update() nesting depth; redraws/callbacks inside it are deferred
+        self._update_depth = 0
+        self._dirty = False
+        self._cb_dirty = False
 
         self.create_widgets()
 
+    @property
+    def current_start(self) -> Optional[datetime]:
+        """Selected start as a datetime (None before a range is set)."""
+        if self._start_offset is None or self.min_time is None:
+            return None
+        return self.min_time + timedelta(seconds=self._start_offset)
+
+    @current_start.setter
+    def current_start(self, value: Optional[datetime]):
+        self._start_offset = None if value is None else (value - self.min_time).total_seconds()
+
+    @property
+    def current_end(self) -> Optional[datetime]:
+        """Selected end as a datetime (None before a range is set)."""
+        if self._end_offset is None or self.min_time is None:
+            return None
+        return self.min_time + timedelta(seconds=self._end_offset)
+
+    @current_end.setter
+    def current_end(self, value: Optional[datetime]):
+        self._end_offset = None if value is None else (value - self.min_time).total_seconds()
+
     def create_widgets(self):
         """Create the (now taller) time range selector widgets"""
+        # Resolve each font once; items and buttons share these objects
+        self._font_label = tkfont.Font(family='Segoe UI', size=7)
+        self._font_btn = tkfont.Font(family='Segoe UI', size=8)
+        self._font_empty = tkfont.Font(family='Segoe UI', size=9)
+
         container = tk.Frame(self, bg=self.COLORS['bg_primary'])
         container.pack(fill=tk.X)
 
@@ -79,6 +182,10 @@ class TimeRangeSelector(ttk.Frame):
         # Add extra top‐padding so nothing above overlaps
         self.canvas.pack(pady=(15, 5))
 
+        # Each handle is one image item instead of three ovals
+        self._handle_img = self._make_handle_image(self.COLORS['handle_border'], 2)
+        self._handle_img_active = self._make_handle_image(self.COLORS['accent_hover'], 4)
+
         # Bind mouse events
         self.canvas.bind('<Button-1>', self.on_mouse_down)
         self.canvas.bind('<B1-Motion>', self.on_mouse_drag)
@@ -95,7 +202,7 @@ class TimeRangeSelector(ttk.Frame):
                               command=self.reset_range,
                               bg=self.COLORS['bg_tertiary'],
                               fg=self.COLORS['text_primary'],
-                              font=('Segoe UI', 8),
+                              font=self._font_btn,
                               relief='flat',
                               borderwidth=1,
                               highlightbackground=self.COLORS['border'],
@@ -108,7 +215,7 @@ class TimeRangeSelector(ttk.Frame):
                               command=self.apply_selection,
                               bg=self.COLORS['accent'],
                               fg='white',
-                              font=('Segoe UI', 8),
+                              font=self._font_btn,
                               relief='flat',
                               borderwidth=0,
                               padx=12, pady=4,
@@ -121,6 +228,42 @@ class TimeRangeSelector(ttk.Frame):
         # Draw the slider (initially empty)
         self.draw_slider()
 
+    def _make_handle_image(self, ring_color: str, ring_width: int) -> tk.PhotoImage:
+        """Render a handle (shadow, ring, fill and center dot) into one sprite."""
+        radius = self.handle_size / 2
+        size = self.handle_size + 6  # room for a 4px ring plus the shadow offset
+        center = size / 2
+        img = tk.PhotoImage(master=self.canvas, width=size, height=size)
+
+        # Pixels never put() stay transparent, so each row is written as its
+        # opaque runs: one Tk call per run instead of one per pixel
+        for y in range(size):
+            row = []
+            for x in range(size):
+                dx, dy = x + 0.5 - center, y + 0.5 - center
+                dist = math.hypot(dx, dy)
+                if dist <= 2:
+                    row.append(self.COLORS['handle_border'])
+                elif dist <= radius - ring_width / 2:
+                    row.append(self.COLORS['handle_bg'])
+                elif dist <= radius + ring_width / 2:
+                    row.append(ring_color)
+                elif math.hypot(dx - 1, dy - 1) <= radius:
+                    row.append(self.COLORS['handle_shadow'])
+                else:
+                    row.append(None)
+
+            x = 0
+            while x < size:
+                if row[x] is None:
+                    x += 1
+                    continue
+                run_start = x
+                while x < size and row[x] is not None:
+                    x += 1
+                img.put('{' + ' '.join(row[run_start:x]) + '}', to=(run_start, y))
+        return img
+
     def add_hover_effect(self, widget, normal_color, hover_color):
         """Add hover effect to a button"""
         def on_enter(event):
@@ -134,18 +277,41 @@ class TimeRangeSelector(ttk.Frame):
         """Initialize the available full time range (called by main window)"""
         self.min_time = min_time
         self.max_time = max_time
+        self._min_label = min_time.strftime("%H:%M:%S")
+        self._max_label = max_time.strftime("%H:%M:%S")
+        self._snap_points = None  # offsets were relative to the old min_time
+        self._update_geometry()
 
         # Start + end default to the full range
-        self.current_start = min_time
-        self.current_end = max_time
+        self._start_offset = 0.0
+        self._end_offset = self._total_duration_s
 
         # Compute handle positions from those datetimes
         self.calculate_handle_positions()
-        self.draw_slider()
+        self._schedule_redraw()
 
         # Notify the parent immediately of the full‐range selection
-        if self.on_range_change:
-            self.on_range_change(self.current_start, self.current_end)
+        self._fire_callback()
+
+    @contextmanager
+    def batch_update(self):
+        """
+        Group several programmatic changes (e.g. set_time_range + set_selected_range)
+        into a single redraw and at most one on_range_change call on exit.
+        """
+        self._update_depth += 1
+        try:
+            yield self
+        finally:
+            self._update_depth -= 1
+            if self._update_depth == 0:
+                if self._dirty:
+                    self._dirty = False
+                    self.calculate_handle_positions()
+                    self._schedule_redraw()
+                if self._cb_dirty:
+                    self._cb_dirty = False
+                    self._fire_callback()
 
     def get_selected_range(self) -> Tuple[Optional[datetime], Optional[datetime]]:
         """Return the currently selected (start, end) as datetimes."""
@@ -159,277 +325,405 @@ class TimeRangeSelector(ttk.Frame):
         self.step_seconds = seconds
 
         # Snap current_start/current_end to the nearest multiple of step_seconds
-        if self.min_time and self.current_start is not None and self.current_end is not None:
-            total_seconds_full = (self.current_start - self.min_time).total_seconds()
-            snapped_start_offset = round(total_seconds_full / self.step_seconds) * self.step_seconds
-            self.current_start = self.min_time + timedelta(seconds=snapped_start_offset)
-
-            total_seconds_full = (self.current_end - self.min_time).total_seconds()
-            snapped_end_offset = round(total_seconds_full / self.step_seconds) * self.step_seconds
-            self.current_end = self.min_time + timedelta(seconds=snapped_end_offset)
+        if self.min_time and self._start_offset is not None and self._end_offset is not None:
+            self._start_offset, self._end_offset = self._snap_offsets(
+                np.array([self._start_offset, self._end_offset])).tolist()
 
             # Re‐compute handle x positions from the snapped times
             self.calculate_handle_positions()
-            self.draw_slider()
+            self._schedule_redraw()
 
         # If desired, you could also immediately fire on_range_change with the newly‐snapped values:
-        if self.on_range_change and self.current_start and self.current_end:
-            self.on_range_change(self.current_start, self.current_end)
+        if self._start_offset is not None and self._end_offset is not None:
+            self._fire_callback()
+
+    def _update_geometry(self, width: int = 0, height: int = 0):
+        """Refresh the cached canvas size, track width and range duration."""
+        # The size only changes through <Configure>, so keep the last one seen
+        self._canvas_width = width or self._canvas_width
+        self._canvas_height = height or self._canvas_height
+        self._track_y = self._canvas_height // 2
+        self._track_y0 = self._track_y - self._thalf
+        self._track_y1 = self._track_y + self._thalf
+        self._label_y = self._track_y + 25
+        self._static_dirty = True
+        self._track_width = self._canvas_width - (2 * self.margin)
+        if self.min_time and self.max_time:
+            self._total_duration_s = (self.max_time - self.min_time).total_seconds()
+        else:
+            self._total_duration_s = 0.0
+
+        # Drag math becomes a multiply and an add
+        if self._track_width > 0 and self._total_duration_s > 0:
+            self._secs_per_pixel = self._total_duration_s / self._track_width
+            self._pixels_per_sec = 1.0 / self._secs_per_pixel
+        else:
+            self._secs_per_pixel = 0.0
+            self._pixels_per_sec = 0.0
+
+    def set_snap_points(self, offsets_seconds: Optional[np.ndarray]):
+        """
+        Snap handles to these offsets (seconds from min_time), e.g. the actual
+        log timestamps, instead of multiples of step_seconds. None restores step snapping.
+        """
+        if offsets_seconds is None or len(offsets_seconds) == 0:
+            self._snap_points = None
+        else:
+            self._snap_points = np.sort(np.asarray(offsets_seconds, dtype=float))
+
+    def _snap_offset(self, seconds: float) -> float:
+        """Snap an offset from min_time to step_seconds (or the snap points), clamped to the range."""
+        points = self._snap_points
+        if points is not None:
+            # Nearest of the two neighbouring snap points
+            i = int(np.searchsorted(points, seconds))
+            if i == 0:
+                snapped = points[0]
+            elif i == len(points):
+                snapped = points[-1]
+            else:
+                lo, hi = points[i - 1], points[i]
+                snapped = lo if seconds - lo <= hi - seconds else hi
+            snapped = float(snapped)
+        else:
+            snapped = round(seconds / self.step_seconds) * self.step_seconds
+        return max(0, min(snapped, self._total_duration_s))
+
+    def _snap_offsets(self, offsets: np.ndarray) -> np.ndarray:
+        """Vectorized _snap_offset() for snapping several offsets in one call."""
+        points = self._snap_points
+        if points is not None:
+            i = np.clip(np.searchsorted(points, offsets), 1, max(len(points) - 1, 1))
+            lo = points[i - 1]
+            hi = points[np.minimum(i, len(points) - 1)]
+            snapped = np.where(offsets - lo <= hi - offsets, lo, hi)
+        else:
+            snapped = np.round(offsets / self.step_seconds) * self.step_seconds
+        return np.clip(snapped, 0, self._total_duration_s)
 
     def calculate_handle_positions(self):
         """Compute the X‐coordinates of each handle given current_start/end."""
+        if self._update_depth:
+            self._dirty = True
+            return
         if not (self.min_time and self.max_time):
             return
 
-        canvas_width = self.canvas.winfo_width() or self.slider_width
-        track_width = canvas_width - (2 * self.margin)
-        total_duration = (self.max_time - self.min_time).total_seconds()
-
-        if total_duration <= 0:
+        if self._total_duration_s <= 0:
             return
 
-        # Snap current_start/end to step_seconds before computing ratio:
-        start_offset = (self.current_start - self.min_time).total_seconds()
-        end_offset = (self.current_end - self.min_time).total_seconds()
+        self.start_handle_x = self.margin + self._start_offset * self._pixels_per_sec
+        self.end_handle_x   = self.margin + self._end_offset   * self._pixels_per_sec
 
-        start_ratio = start_offset / total_duration
-        end_ratio = end_offset / total_duration
-
-        self.start_handle_x = self.margin + (start_ratio * track_width)
-        self.end_handle_x   = self.margin + (end_ratio   * track_width)
+    def calculate_offset_from_position(self, x_position: float) -> float:
+        """
+        Given an X on the Canvas, return the corresponding offset in seconds
+        from min_time, snapped to the nearest `step_seconds`.
+        """
+        # Clamp X to [margin, margin+track_width]
+        x_position = max(self.margin, min(x_position, self.margin + self._track_width))
+        return self._snap_offset((x_position - self.margin) * self._secs_per_pixel)
 
     def calculate_time_from_position(self, x_position: float) -> datetime:
         """
         Given an X on the Canvas, return the corresponding datetime,
         snapped to the nearest `step_seconds`.
         """
-        canvas_width = self.canvas.winfo_width() or self.slider_width
-        track_width = canvas_width - (2 * self.margin)
+        return self.min_time + timedelta(seconds=self.calculate_offset_from_position(x_position))
 
-        # Clamp X to [margin, margin+track_width]
-        x_position = max(self.margin, min(x_position, self.margin + track_width))
+    def _build_items(self):
+        """Create every slider item once; draw_slider() only moves them afterwards"""
+        self.canvas.delete("all")
+        self._placeholder_id = None
+        create_rect = self.canvas.create_rectangle
+        ids = {}
+
+        ids['track_bg'] = create_rect(0, 0, 0, 0, **self.TRACK_BG_OPTS)
+        ids['track_selected'] = create_rect(0, 0, 0, 0, **self.TRACK_SELECTED_OPTS)
 
-        ratio = (x_position - self.margin) / track_width
-        total_secs = (self.max_time - self.min_time).total_seconds()
-        raw_seconds = ratio * total_secs
+        for name in ('start', 'end'):
+            image = self._handle_img_active if self.dragging == name else self._handle_img
+            ids[f'{name}_handle'] = self.canvas.create_image(
+                0, 0, image=image, anchor='center')
 
-        # Snap raw_seconds to the nearest multiple of step_seconds:
-        snapped_offset = round(raw_seconds / self.step_seconds) * self.step_seconds
-        snapped_offset = max(0, min(snapped_offset, total_secs))
+        # Label text is filled in by draw_slider() whenever the range changes
+        ids['min_label'] = self.canvas.create_text(0, 0, font=self._font_label, **self.LABEL_OPTS)
+        ids['max_label'] = self.canvas.create_text(0, 0, font=self._font_label, **self.LABEL_OPTS)
 
-        return self.min_time + timedelta(seconds=snapped_offset)
+        self._item_ids = ids
+        self._shown_labels = None
+        self._selected_visible = True
+        self._static_dirty = True
+        self._built = True
 
     def draw_slider(self):
         """Draw the track, the selected‐range bar, and the two handles (taller canvas)"""
-        self.canvas.delete("all")
+        if self._update_depth:
+            self._dirty = True
+            return
         if not (self.min_time and self.max_time):
-            # No session loaded yet → display a placeholder
-            self.canvas.create_text(
-                self.slider_width // 2, self.slider_height // 2,
+            # No session loaded yet → display a placeholder (created once, re-centered after)
+            if self._placeholder_id is not None:
+                self.canvas.coords(self._placeholder_id,
+                                   self._canvas_width // 2, self._canvas_height // 2)
+                return
+            self.canvas.delete("all")
+            self._item_ids = {}
+            self._built = False
+            self._placeholder_id = self.canvas.create_text(
+                self._canvas_width // 2, self._canvas_height // 2,
                 text="Select a session to view time range",
-                font=('Segoe UI', 9),
+                font=self._font_empty,
                 fill=self.COLORS['text_secondary']
             )
             return
 
         # Make sure current_start/end exist
-        if not (self.current_start and self.current_end):
-            self.current_start = self.min_time
-            self.current_end   = self.max_time
+        if self._start_offset is None or self._end_offset is None:
+            self._start_offset = 0.0
+            self._end_offset   = self._total_duration_s
             self.calculate_handle_positions()
 
-        canvas_w = self.canvas.winfo_width() or self.slider_width
-        canvas_h = self.canvas.winfo_height() or self.slider_height
-        track_y = canvas_h // 2
-        track_start = self.margin
-        track_end   = canvas_w - self.margin
-
-        # Draw the background track
-        self.canvas.create_rectangle(
-            track_start, track_y - self.track_height // 2,
-            track_end,   track_y + self.track_height // 2,
-            fill=self.COLORS['track_bg'],
-            outline='',
-            tags='track_bg'
-        )
+        if not self._built:
+            self._build_items()
+        ids = self._item_ids
+        coords = self.canvas.coords
 
-        # Draw the “selected range” in accent color
-        if self.start_handle_x < self.end_handle_x:
-            self.canvas.create_rectangle(
-                self.start_handle_x, track_y - self.track_height // 2,
-                self.end_handle_x,   track_y + self.track_height // 2,
-                fill=self.COLORS['track_selected'],
-                outline='',
-                tags='track_selected'
-            )
+        track_y0 = self._track_y0
+        track_y1 = self._track_y1
 
-        # Draw “Start” handle (with shadow)
-        # Shadow:
-        self.canvas.create_oval(
-            self.start_handle_x - self.handle_size // 2 + 1,
-            track_y - self.handle_size // 2 + 1,
-            self.start_handle_x + self.handle_size // 2 + 1,
-            track_y + self.handle_size // 2 + 1,
-            fill=self.COLORS['handle_shadow'],
-            outline='',
-            tags='start_handle_shadow'
-        )
-        # Handle circle:
-        self.canvas.create_oval(
-            self.start_handle_x - self.handle_size // 2,
-            track_y - self.handle_size // 2,
-            self.start_handle_x + self.handle_size // 2,
-            track_y + self.handle_size // 2,
-            fill=self.COLORS['handle_bg'],
-            outline=self.COLORS['handle_border'],
-            width=2,
-            tags='start_handle'
-        )
-        # Center dot:
-        self.canvas.create_oval(
-            self.start_handle_x - 2,
-            track_y - 2,
-            self.start_handle_x + 2,
-            track_y + 2,
-            fill=self.COLORS['handle_border'],
-            outline='',
-            tags='start_handle_dot'
-        )
+        if self._static_dirty:
+            # Background track and min/max labels BELOW the track
+            track_start = self.margin
+            track_end   = self._canvas_width - self.margin
+            coords(ids['track_bg'], track_start, track_y0, track_end, track_y1)
+            coords(ids['min_label'], track_start, self._label_y)
+            coords(ids['max_label'], track_end, self._label_y)
+            self._static_dirty = False
 
-        # Draw “End” handle (with shadow)
-        self.canvas.create_oval(
-            self.end_handle_x - self.handle_size // 2 + 1,
-            track_y - self.handle_size // 2 + 1,
-            self.end_handle_x + self.handle_size // 2 + 1,
-            track_y + self.handle_size // 2 + 1,
-            fill=self.COLORS['handle_shadow'],
-            outline='',
-            tags='end_handle_shadow'
-        )
-        self.canvas.create_oval(
-            self.end_handle_x - self.handle_size // 2,
-            track_y - self.handle_size // 2,
-            self.end_handle_x + self.handle_size // 2,
-            track_y + self.handle_size // 2,
-            fill=self.COLORS['handle_bg'],
-            outline=self.COLORS['handle_border'],
-            width=2,
-            tags='end_handle'
-        )
-        self.canvas.create_oval(
-            self.end_handle_x - 2,
-            track_y - 2,
-            self.end_handle_x + 2,
-            track_y + 2,
-            fill=self.COLORS['handle_border'],
-            outline='',
-            tags='end_handle_dot'
-        )
-
-        # Draw the min/max time labels BELOW the track
-        self.canvas.create_text(
-            track_start, track_y + 25,
-            text=self.min_time.strftime("%H:%M:%S"),
-            font=('Segoe UI', 7),
-            fill=self.COLORS['text_secondary']
-        )
-        self.canvas.create_text(
-            track_end, track_y + 25,
-            text=self.max_time.strftime("%H:%M:%S"),
-            font=('Segoe UI', 7),
-            fill=self.COLORS['text_secondary']
-        )
+        # “Selected range” in accent color, hidden when the handles meet
+        if self.start_handle_x < self.end_handle_x:
+            coords(ids['track_selected'], self.start_handle_x, track_y0, self.end_handle_x, track_y1)
+            if not self._selected_visible:
+                self.canvas.itemconfigure(ids['track_selected'], state='normal')
+                self._selected_visible = True
+        elif self._selected_visible:
+            self.canvas.itemconfigure(ids['track_selected'], state='hidden')
+            self._selected_visible = False
+
+        # Handle sprites are centered on the handle position
+        track_y = self._track_y
+        coords(ids['start_handle'], int(self.start_handle_x), track_y)
+        coords(ids['end_handle'], int(self.end_handle_x), track_y)
+
+        labels = (self._min_label, self._max_label)
+        if labels != self._shown_labels:
+            self.canvas.itemconfigure(ids['min_label'], text=labels[0])
+            self.canvas.itemconfigure(ids['max_label'], text=labels[1])
+            self._shown_labels = labels
 
     def get_handle_at_position(self, x: float, y: float) -> Optional[str]:
         """Return 'start' or 'end' if the (x,y) is over a handle, else None."""
-        canvas_h = self.canvas.winfo_height() or self.slider_height
-        track_y = canvas_h // 2
-
-        # Check if (x,y) is within the start handle’s circle
-        if (abs(x - self.start_handle_x) <= self.handle_size // 2 and
-                abs(y - track_y) <= self.handle_size // 2):
+        r2 = self._handle_r2
+        dy = y - self._track_y
+        dy2 = dy * dy
+        # Most hover events are off the track row and miss both handles here
+        if dy2 > r2:
+            return None
+
+        dx = x - self.start_handle_x
+        ds2 = dx * dx + dy2
+        dx = x - self.end_handle_x
+        de2 = dx * dx + dy2
+
+        # Overlapping handles (a collapsed range): the nearer one wins
+        if ds2 <= r2 and ds2 <= de2:
             return 'start'
-
-        # Check end handle
-        if (abs(x - self.end_handle_x) <= self.handle_size // 2 and
-                abs(y - track_y) <= self.handle_size // 2):
+        if de2 <= r2:
             return 'end'
-
         return None
 
     def on_mouse_down(self, event):
         """When user clicks, decide if they’re on the start or end handle."""
         if not (self.min_time and self.max_time):
             return
+        # Handles must be on screen (and have item ids) before they can be grabbed
+        self._flush_redraw()
         handle = self.get_handle_at_position(event.x, event.y)
         if handle:
             self.dragging = handle
-            self.canvas.config(cursor='hand2')
+            self._set_cursor('hand2')
             # Highlight the dragged handle
-            if handle == 'start':
-                self.canvas.itemconfig('start_handle', outline=self.COLORS['accent_hover'], width=4)
-            else:
-                self.canvas.itemconfig('end_handle', outline=self.COLORS['accent_hover'], width=4)
+            self.canvas.itemconfig(self._item_ids[f'{handle}_handle'], image=self._handle_img_active)
 
     def on_mouse_drag(self, event):
-        """While dragging, move either the start or the end handle."""
+        """While dragging, record the pointer; only the latest x of a burst is processed."""
         if not (self.dragging and self.min_time and self.max_time):
             return
+        if self._pending_motion_x is None:
+            self.canvas.after_idle(self._flush_draw)
+        self._pending_motion_x = event.x
+
+    def _flush_draw(self):
+        """Move the dragged handle to the most recent pointer x, then redraw once."""
+        x = self._pending_motion_x
+        if x is None:
+            return
+        self._pending_motion_x = None
+        if self._move_dragged_handle(x):
+            self.draw_slider()
+            self._maybe_fire_callback()
 
+    def _move_dragged_handle(self, x: int) -> bool:
+        """Move either the start or the end handle; return False if nothing changed."""
+        # Handles sit on the snapped time, so motion that snaps to the same
+        # step changes nothing and is dropped before any redraw or callback
         if self.dragging == 'start':
             # New X for the start handle is between [margin, end_handle_x]
-            new_x = max(self.margin, min(event.x, self.end_handle_x))
-            self.start_handle_x = new_x
-            self.current_start = self.calculate_time_from_position(self.start_handle_x)
+            new_x = max(self.margin, min(x, self.end_handle_x))
+            new_start = min(self.calculate_offset_from_position(new_x), self._end_offset)
+            if new_start == self._start_offset:
+                return False
+            self._start_offset = new_start
+            self.start_handle_x = self.margin + new_start * self._pixels_per_sec
 
         elif self.dragging == 'end':
             # New X for the end handle is between [start_handle_x, canvas_width - margin]
-            cw = self.canvas.winfo_width() or self.slider_width
-            max_x = cw - self.margin
-            new_x = max(self.start_handle_x, min(event.x, max_x))
-            self.end_handle_x = new_x
-            self.current_end = self.calculate_time_from_position(self.end_handle_x)
-
+            max_x = self._canvas_width - self.margin
+            new_x = max(self.start_handle_x, min(x, max_x))
+            new_end = max(self.calculate_offset_from_position(new_x), self._start_offset)
+            if new_end == self._end_offset:
+                return False
+            self._end_offset = new_end
+            self.end_handle_x = self.margin + new_end * self._pixels_per_sec
+
+        return True
+
+    def _schedule_redraw(self):
+        """Redraw once on the next idle cycle, however many changes come before it."""
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.after_idle(self._flush_redraw)
+
+    def _flush_redraw(self):
+        """Run the redraw requested by _schedule_redraw(), unless it already ran."""
+        if not self._redraw_pending:
+            return
+        self._redraw_pending = False
         self.draw_slider()
+
+    def _maybe_fire_callback(self):
+        """Fire on_range_change at most once per _cb_interval_ms, with a trailing call."""
+        if not self.on_range_change or self._cb_after_id is not None:
+            # A trailing call is already scheduled and will read the latest range
+            return
+        if self.dragging and self._defer_during_drag:
+            # The consumer is too slow for live updates; mouse-up delivers the range
+            return
+        if self._last_cb_range == (self._start_offset, self._end_offset):
+            return
+        elapsed = time.monotonic() * 1000 - self._last_cb_ms
+        if elapsed >= self._cb_interval_ms:
+            self._fire_callback()
+        else:
+            self._cb_after_id = self.after(int(self._cb_interval_ms - elapsed) + 1,
+                                           self._fire_callback)
+
+    def _fire_callback(self):
+        """Deliver the current range to on_range_change now (or when the batch ends)."""
+        if self._update_depth:
+            self._cb_dirty = True
+            return
+        if self._cb_after_id is not None:
+            self.after_cancel(self._cb_after_id)
+            self._cb_after_id = None
+        self._last_cb_ms = time.monotonic() * 1000
+        self._last_cb_range = (self._start_offset, self._end_offset)
         if self.on_range_change:
+            started = time.perf_counter()
             self.on_range_change(self.current_start, self.current_end)
+            if self.dragging and time.perf_counter() - started > self._defer_threshold_s:
+                self._defer_during_drag = True
 
     def on_mouse_up(self, event):
         """Reset handle outline when user releases the mouse."""
         if self.dragging:
-            self.canvas.itemconfig('start_handle', outline=self.COLORS['handle_border'], width=2)
-            self.canvas.itemconfig('end_handle',   outline=self.COLORS['handle_border'], width=2)
+            # Apply the final drag position before the idle callback gets to it
+            x = self._pending_motion_x
+            self._pending_motion_x = None
+            if x is not None and self._move_dragged_handle(x):
+                self._schedule_redraw()
+            self.canvas.itemconfig(self._item_ids[f'{self.dragging}_handle'], image=self._handle_img)
+            # The throttle may have held back the last value; always deliver it
+            if self._cb_after_id is not None or \
+                    self._last_cb_range != (self._start_offset, self._end_offset):
+                self._fire_callback()
+            self._defer_during_drag = False
         self.dragging = None
-        self.canvas.config(cursor='')
+        self._set_cursor('')
+        self._last_motion_xy = None
 
     def on_mouse_move(self, event):
-        """Change cursor to a hand if over a handle."""
-        if not self.dragging:
-            handle = self.get_handle_at_position(event.x, event.y)
-            if handle:
-                self.canvas.config(cursor='hand2')
-            else:
-                self.canvas.config(cursor='')
+        """Record the hover position; high-rate mice get one hit-test per 16 ms."""
+        if self.dragging:
+            return
+        if self._pending_hover_xy is None:
+            self.after(self._hover_interval_ms, self._flush_hover)
+        self._pending_hover_xy = (event.x, event.y)
+
+    def _flush_hover(self):
+        """Change cursor to a hand if the latest hover position is over a handle."""
+        xy = self._pending_hover_xy
+        self._pending_hover_xy = None
+        if xy is None or self.dragging:
+            return
+        # Tk repeats <Motion> for an unmoved pointer; the answer cannot change
+        if xy == self._last_motion_xy:
+            return
+        self._last_motion_xy = xy
+        handle = self.get_handle_at_position(*xy)
+        self._set_cursor('hand2' if handle else '')
+
+    def _set_cursor(self, cursor: str):
+        """Configure the canvas cursor only when it actually changes."""
+        if cursor != self._cursor:
+            self.canvas.config(cursor=cursor)
+            self._cursor = cursor
 
     def on_resize(self, event):
-        """When the Canvas is resized, recalculate handle positions & redraw."""
+        """When the Canvas is resized, recalculate handle positions & redraw (once per idle cycle)."""
+        size = (event.width, event.height)
+        if self._pending_size is None:
+            # Tk also sends <Configure> for moves/restacking; ignore same-size events
+            if size == (self._canvas_width, self._canvas_height):
+                return
+            self.after_idle(self._do_resize)
+        self._pending_size = size
+
+    def _do_resize(self):
+        """Apply the most recent canvas size; items are moved, not recreated."""
+        if self._pending_size is None:
+            return
+        width, height = self._pending_size
+        self._pending_size = None
+        if (width, height) == (self._canvas_width, self._canvas_height):
+            return  # the burst ended back at the current size
+        self._update_geometry(width, height)
         self.calculate_handle_positions()
         self.draw_slider()
 
     def reset_range(self):
         """Reset both handles to the full min→max range."""
         if self.min_time and self.max_time:
-            self.current_start = self.min_time
-            self.current_end = self.max_time
+            self._start_offset = 0.0
+            self._end_offset = self._total_duration_s
             self.calculate_handle_positions()
-            self.draw_slider()
-            if self.on_range_change:
-                self.on_range_change(self.current_start, self.current_end)
+            self._schedule_redraw()
+            self._fire_callback()
 
     def apply_selection(self):
         """Explicitly fire the on_range_change callback with the current range."""
-        if self.on_range_change:
-            self.on_range_change(self.current_start, self.current_end)
+        self._fire_callback()
 
     def set_selected_range(self, start_time: Optional[datetime], end_time: Optional[datetime]):
         """
@@ -439,22 +733,15 @@ class TimeRangeSelector(ttk.Frame):
         if not (self.min_time and self.max_time):
             return
 
-        if start_time:
-            clamped_start = max(self.min_time, min(start_time, self.max_time))
-            total_sec = (clamped_start - self.min_time).total_seconds()
-            snapped = round(total_sec / self.step_seconds) * self.step_seconds
-            self.current_start = self.min_time + timedelta(seconds=snapped)
-
-        if end_time:
-            clamped_end = max(self.min_time, min(end_time, self.max_time))
-            total_sec = (clamped_end - self.min_time).total_seconds()
-            snapped = round(total_sec / self.step_seconds) * self.step_seconds
-            self.current_end = self.min_time + timedelta(seconds=snapped)
+        offsets = np.array([
+            (start_time - self.min_time).total_seconds() if start_time else self._start_offset,
+            (end_time - self.min_time).total_seconds() if end_time else self._end_offset,
+        ], dtype=float)
+        start, end = self._snap_offsets(offsets).tolist()
 
         # Ensure start ≤ end
-        if self.current_start > self.current_end:
-            self.current_start, self.current_end = self.current_end, self.current_start
+        self._start_offset, self._end_offset = min(start, end), max(start, end)
 
         self.calculate_handle_positions()
-        self.draw_slider()
+        self._schedule_redraw()
 
@@ -11,6 +11,8 @@ from gui.main_window import DroneLogAnalyzer
 def main():
     """Main application entry point"""
     root = tk.Tk()
+    # Keep the window hidden until it is fully built, so no half-drawn frame flickers up
+    root.withdraw()
     
     # ─── Make the app DPI‐aware on Windows ────────────────────────────────
     if sys.platform.startswith("win"):
@@ -24,7 +26,7 @@ def main():
                 pass
     
     # ─── Instead of a hard‐coded 1920x1080, size to 90% of the real screen ─
-    root.update_idletasks()
+    # (screen size comes straight from the display; no idle flush needed)
     screen_w = root.winfo_screenwidth()
     screen_h = root.winfo_screenheight()
     
@@ -46,6 +48,7 @@ def main():
     # ─── Set title, then create the app ────────────────────────────────────
     root.title("Drone Log Analyzer v2.0")
     app = DroneLogAnalyzer(root)
+    root.deiconify()
     
     try:
         root.mainloop()
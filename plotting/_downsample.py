@@ -0,0 +1,34 @@
+"""
+Min/max downsampling for dense time series
+Keeps the extremes of every pixel-wide bucket so the drawn line looks the same
+"""
+
+import numpy as np
+from typing import Tuple
+
+
+def minmax_downsample(t: np.ndarray, v: np.ndarray, n_buckets: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Reduce (t, v) to the first/last sample plus each bucket's min and max, in time order"""
+    n = len(v)
+    if n_buckets <= 0 or n <= 2 * n_buckets:
+        return t, v
+    
+    # Equal-width buckets (sizes differ by at most one sample)
+    starts = np.linspace(0, n, n_buckets, endpoint=False).astype(np.intp)
+    bucket_ids = np.repeat(np.arange(n_buckets), np.diff(np.append(starts, n)))
+    
+    # fmin/fmax ignore NaN when finding the extremes
+    mins = np.fmin.reduceat(v, starts)
+    maxs = np.fmax.reduceat(v, starts)
+    
+    keep = [np.array([0, n - 1])]
+    for hits in (np.flatnonzero(v == mins[bucket_ids]),
+                 np.flatnonzero(v == maxs[bucket_ids]),
+                 # One NaN per bucket that has a dropout, so the line still breaks there
+                 np.flatnonzero(np.isnan(v))):
+        # First hit per bucket
+        _, first = np.unique(bucket_ids[hits], return_index=True)
+        keep.append(hits[first])
+    
+    idx = np.unique(np.concatenate(keep))
+    return t[idx], v[idx]
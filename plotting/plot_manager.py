@@ -3,12 +3,27 @@ Plot Manager Module
 Handles all plotting and visualization functionality with modern styling
 """
 
+import re
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.figure import Figure
+import matplotlib
+import matplotlib.dates as mdates
 from datetime import datetime
-from typing import Dict, List, Tuple, Any
-import pandas as pd
+from functools import lru_cache
+from typing import Dict, List, Tuple, Any, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
+from ._downsample import minmax_downsample
+
+# Set once the modern rcParams theme has been applied
+_THEME_APPLIED = False
+
+# Min/max-downsample series much denser than the axes are wide (kill switch)
+DOWNSAMPLE = True
+# Floor for the bucket count: the embedded figure starts tiny and only grows
+# to the window size after the first plot has been built
+MIN_DOWNSAMPLE_BUCKETS = 2000
 
 class DataGrouper:
     """Groups data by similar characteristics for separate plotting"""
@@ -53,6 +68,9 @@ class DataGrouper:
         }
     }
     
+    # Group ids index this tuple; 'Other' is always last
+    GROUP_NAMES = tuple(DATA_GROUPS) + ('Other',)
+    
     @classmethod
     def group_data(cls, data: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Dict[str, Any]]]:
         """Group data by similar characteristics"""
@@ -69,14 +87,40 @@ class DataGrouper:
     @classmethod
     def _classify_data(cls, data_key: str, data_info: Dict[str, Any]) -> str:
         """Classify data into appropriate group"""
-        data_key_lower = data_key.lower()
-        
-        for group_name, group_config in cls.DATA_GROUPS.items():
-            for keyword in group_config['keywords']:
-                if keyword in data_key_lower:
-                    return group_name
-        
-        return 'Other'
+        return _classify_key(data_key.lower())
+    
+    @classmethod
+    def group_id(cls, data_key: str) -> int:
+        """Index of the data key's group in GROUP_NAMES"""
+        return _GROUP_INDEX[_classify_key(data_key.lower())]
+
+# One compiled keyword alternation per group, in DATA_GROUPS (priority) order
+_GROUP_REGEXES = [
+    (group_name, re.compile('|'.join(re.escape(k) for k in group_config['keywords'])))
+    for group_name, group_config in DataGrouper.DATA_GROUPS.items()
+]
+
+_GROUP_INDEX = {group_name: i for i, group_name in enumerate(DataGrouper.GROUP_NAMES)}
+
+# Modern unit formatting for each group's y axis
+_GROUP_YLABELS = {
+    'Depth & Pressure': 'Depth (m) • Pressure (mbar)',
+    'Temperature': 'Temperature (°C)',
+    'Orientation': 'Angle (degrees)',
+    'Voltage & Current': 'Voltage (V) • Current (A)',
+    'Motor Data': 'PWM Value',
+    'Sonar & Distance': 'Distance (m) • Confidence (%)',
+    'Other': 'Value'
+}
+
+@lru_cache(maxsize=1024)
+def _classify_key(data_key_lower: str) -> str:
+    """Group name for a lower-cased data key; cached since the same keys are replotted often"""
+    for group_name, regex in _GROUP_REGEXES:
+        if regex.search(data_key_lower):
+            return group_name
+    
+    return 'Other'
 
 class PlotStyler:
     """Handles modern plot styling and aesthetics"""
@@ -106,23 +150,34 @@ class PlotStyler:
         'Greys': ['#374151', '#4b5563', '#6b7280', '#9ca3af', '#d1d5db', '#f3f4f6']
     }
     
+    # Path simplification thresholds (in pixels): the default drops sub-pixel
+    # segments of dense lines, high-fidelity mode keeps almost every vertex
+    SIMPLIFY_THRESHOLD = 1.0
+    HIGH_FIDELITY_SIMPLIFY_THRESHOLD = 0.1
+    
     @staticmethod
     def get_colors(n_colors: int, scheme: str = 'default') -> List[str]:
         """Get modern color palette for plotting with VIBRANT colors"""
+        palettes = PlotStyler._PALETTES.get(scheme, PlotStyler._PALETTES['default'])
+        palette = palettes.get(n_colors)
+        if palette is None:
+            palette = PlotStyler._get_colors_cached(n_colors, scheme)
+        return list(palette)
+    
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _get_colors_cached(n_colors: int, scheme: str) -> Tuple[str, ...]:
+        """Immutable palette per (n_colors, scheme), built once"""
         if scheme in PlotStyler.COLOR_SCHEMES:
             colors = PlotStyler.COLOR_SCHEMES[scheme]
         else:
             colors = PlotStyler.MODERN_COLORS
         
         if n_colors <= len(colors):
-            return colors[:n_colors]
+            return tuple(colors[:n_colors])
         else:
             # Cycle through colors if we need more, but use the most vibrant ones first
-            result = []
-            for i in range(n_colors):
-                color_idx = i % len(colors)
-                result.append(colors[color_idx])
-            return result
+            return tuple(colors[i % len(colors)] for i in range(n_colors))
     
     @staticmethod
     def style_axis(ax, title: str = "", xlabel: str = "", ylabel: str = "", 
@@ -160,12 +215,17 @@ class PlotStyler:
         ax.spines['right'].set_visible(False)
     
     @staticmethod
-    def apply_modern_theme():
-        """Apply modern theme to matplotlib"""
+    def apply_modern_theme(force: bool = False):
+        """Apply modern theme to matplotlib (once per process unless `force`)"""
+        global _THEME_APPLIED
+        if _THEME_APPLIED and not force:
+            return
+        _THEME_APPLIED = True
+        
         # Set modern style parameters
-        plt.rcParams.update({
+        matplotlib.rcParams.update({
             'font.family': 'sans-serif',
-            'font.sans-serif': ['Segoe UI', 'Arial', 'DejaVu Sans'],
+            'font.sans-serif': list(_resolve_sans_font()),
             'font.size': 10,
             'axes.titlesize': 14,
             'axes.labelsize': 11,
@@ -186,27 +246,113 @@ class PlotStyler:
             'savefig.facecolor': '#ffffff',
             'savefig.edgecolor': 'none',
             'savefig.bbox': 'tight',
-            'savefig.pad_inches': 0.2
+            'savefig.pad_inches': 0.2,
+            # Skip invisible segments of high-frequency log data at draw time
+            'path.simplify': True,
+            'path.simplify_threshold': PlotStyler.SIMPLIFY_THRESHOLD,
+            'agg.path.chunksize': 10000
         })
+    
+    @staticmethod
+    def set_high_fidelity(enabled: bool):
+        """Switch between normal and high-fidelity path simplification"""
+        # Read when a line's path is built, so it applies to the next plot
+        matplotlib.rcParams['path.simplify_threshold'] = (
+            PlotStyler.HIGH_FIDELITY_SIMPLIFY_THRESHOLD if enabled
+            else PlotStyler.SIMPLIFY_THRESHOLD)
+
+_THEME_FONTS = ('Segoe UI', 'Arial', 'DejaVu Sans')
+
+@lru_cache(maxsize=None)
+def _resolve_sans_font() -> tuple:
+    """Theme fonts with the first installed one moved to the front, looked up once per process
+
+    The rest stay in the list so glyphs missing from the resolved font still fall back.
+    """
+    from matplotlib import font_manager
+    path = font_manager.findfont(
+        font_manager.FontProperties(family=list(_THEME_FONTS)),
+        fallback_to_default=True)
+    resolved = font_manager.FontProperties(fname=path).get_name()
+    return tuple(dict.fromkeys((resolved,) + _THEME_FONTS))
+
+# Palettes for up to 32 series per scheme, built at import so get_colors() is a lookup
+PlotStyler._PALETTES = {
+    scheme: {n: PlotStyler._get_colors_cached(n, scheme) for n in range(1, 33)}
+    for scheme in PlotStyler.COLOR_SCHEMES
+}
 
 class PlotManager:
-    """Modern plot management class"""
+    """Modern plot management class
+    
+    Series arrive as data_info dicts of NumPy arrays: 'timestamp' (datetime64[ns]),
+    'data' (numeric, or object for text columns), 'label' and 'is_string'.
+    """
     
-    def __init__(self, figure: Figure):
+    def __init__(self, figure: 'Figure'):
         self.figure = figure
         self.styler = PlotStyler()
         self.grouper = DataGrouper()
+        self._high_fidelity = False
+        # data_key -> Line2D (None for skipped series) of the current plot
+        self._line_map: Dict[str, Any] = {}
         
-        # Apply modern theme
+        # Apply modern theme; the simplify threshold is reset explicitly since
+        # a previous manager may have left high fidelity on
         self.styler.apply_modern_theme()
+        self.styler.set_high_fidelity(False)
         
         # Configure figure with modern styling
         self.figure.patch.set_facecolor('#ffffff')
         self.figure.patch.set_edgecolor('none')
+        
+        # The outside legends and suptitle rely on constrained layout; set it
+        # here too for figures not created with layout='constrained'
+        if self.figure.get_layout_engine() is None:
+            self.figure.set_layout_engine('constrained')
     
     def clear_plots(self):
         """Clear all plots from figure"""
         self.figure.clear()
+        self._line_map = {}
+    
+    def update_data(self, data: Dict[str, Dict[str, Any]]) -> bool:
+        """Swap new arrays (e.g. a new time window) into the existing lines
+        
+        Axes, legends and titles are kept; only the line data and the view
+        limits change (call request_draw() to show it). Returns False if `data` holds a different set of
+        series than the current plot, which then needs a full create_*.
+        """
+        if not self._line_map or data.keys() != self._line_map.keys():
+            return False
+        
+        axes = set()
+        for data_key, data_info in data.items():
+            line = self._line_map[data_key]
+            series = self._series_arrays(line.axes, data_info) if line is not None else None
+            if (line is None) != (series is None):
+                return False
+            if line is None:
+                continue
+            line.set_data(*series)
+            self._style_line(line, len(data_info['timestamp']), line.get_alpha(), line.get_color())
+            axes.add(line.axes)
+        
+        for ax in axes:
+            ax.relim()
+            # A toolbar zoom/pan turns autoscaling off; the new window must be shown
+            ax.set_autoscale_on(True)
+            ax.autoscale_view()
+        return True
+    
+    def request_draw(self):
+        """Schedule one redraw; call once after a batch of create_*/update_data calls"""
+        self.figure.canvas.draw_idle()
+    
+    def set_high_fidelity(self, enabled: bool):
+        """Draw subsequent plots with (nearly) unsimplified line paths"""
+        self._high_fidelity = enabled
+        self.styler.set_high_fidelity(enabled)
     
     def create_combined_plot(self, data: Dict[str, Dict[str, Any]], 
                            session_name: str = "", show_grid: bool = True):
@@ -219,13 +365,15 @@ class PlotManager:
         
         
         ax = self.figure.add_subplot(111)
+        self._setup_time_axis(ax)
         
         # Get modern colors for all data series - use vibrant colors
         colors = self.styler.get_colors(len(data))
         
         # Plot each data series with modern styling
         for (data_key, data_info), color in zip(data.items(), colors):
-            self._plot_data_series_modern(ax, data_info, color, alpha=0.9)  # Higher alpha for better visibility
+            self._line_map[data_key] = self._plot_data_series_modern(
+                ax, data_info, color, alpha=0.9)  # Higher alpha for better visibility
         
         # Apply modern styling
         title = f'📊 {session_name} - Data Overview' if session_name else '📊 Drone Data Overview'
@@ -249,17 +397,8 @@ class PlotManager:
                 legend.get_frame().set_edgecolor('#e2e8f0')
                 legend.get_frame().set_linewidth(1)
         
-        # Format time axis with modern styling
-        self.figure.autofmt_xdate()
-        
         # Add modern styling touches with better spacing
         ax.margins(x=0.01, y=0.03)
-        
-        # Improved layout
-        self.figure.tight_layout(rect=[0, 0.03, 1, 0.97])
-        
-        # Force a redraw
-        self.figure.canvas.draw_idle()
     
     def create_separate_plots(self, data: Dict[str, Dict[str, Any]], 
                             session_name: str = "", show_grid: bool = True):
@@ -270,33 +409,41 @@ class PlotManager:
             self._create_empty_state()
             return
         
-        # Group data by type
-        groups = self.grouper.group_data(data)
-        n_groups = len(groups)
-        
-        if n_groups == 0:
-            self._create_empty_state()
-            return
-        
-        
-        # Create subplots with better spacing
-        for i, (group_name, group_data) in enumerate(groups.items()):
-            ax = self.figure.add_subplot(n_groups, 1, i + 1)
-            
-            if not group_data:
-                continue
+        # Group data by type: sort the keys by group id (stable, so selection
+        # order is kept within a group) and cut the run at each id change
+        data_keys = list(data)
+        ids = np.fromiter((self.grouper.group_id(k) for k in data_keys),
+                          dtype=np.int8, count=len(data_keys))
+        order = np.argsort(ids, kind='stable')
+        sorted_ids = ids[order]
+        bounds = np.flatnonzero(np.diff(sorted_ids)) + 1
+        starts = np.concatenate(([0], bounds))
+        ends = np.concatenate((bounds, [len(order)]))
+        n_groups = len(starts)
+        
+        # Create all subplots in one call; the shared time axis keeps the groups
+        # aligned, and inner x tick labels are hidden automatically
+        axes = self.figure.subplots(n_groups, 1, sharex=True, squeeze=False)[:, 0]
+        # Shared x axes share one Ticker (and units), so set it up once on the
+        # bottom axes, the one that shows the tick labels
+        self._setup_time_axis(axes[-1])
+        
+        for i, (ax, lo, hi) in enumerate(zip(axes, starts, ends)):
+            group_name = self.grouper.GROUP_NAMES[sorted_ids[lo]]
+            group_keys = [data_keys[j] for j in order[lo:hi]]
             
             # Get VIBRANT color scheme for this group - NO FADING
             color_scheme = self.grouper.DATA_GROUPS.get(group_name, {}).get('color_scheme', 'default')
-            colors = self.styler.get_colors(len(group_data), color_scheme)
+            colors = self.styler.get_colors(len(group_keys), color_scheme)
             
             # Plot data in this group with FULL OPACITY and better styling
-            for (data_key, data_info), color in zip(group_data.items(), colors):
-                self._plot_data_series_modern(ax, data_info, color, alpha=1.0)  # Full opacity!
+            for data_key, color in zip(group_keys, colors):
+                self._line_map[data_key] = self._plot_data_series_modern(
+                    ax, data[data_key], color, alpha=1.0)  # Full opacity!
             
             # Get group icon and style subplot
             group_icon = self.grouper.DATA_GROUPS.get(group_name, {}).get('icon', '📄')
-            ylabel = self._get_group_ylabel(group_name, group_data)
+            ylabel = self._get_group_ylabel(group_name)
             xlabel = 'Time' if i == n_groups - 1 else ''  # Only show xlabel on bottom plot
             
             modern_title = f"{group_icon} {group_name}"
@@ -304,7 +451,7 @@ class PlotManager:
                                  ylabel=ylabel, show_grid=show_grid)
             
             # Modern legend for each subplot with better visibility
-            if len(group_data) > 1:
+            if len(group_keys) > 1:
                 legend = ax.legend(fontsize=9, loc='best', frameon=True, 
                                  fancybox=True, shadow=True, framealpha=1.0)  # Solid background
                 if legend:
@@ -314,24 +461,12 @@ class PlotManager:
             
             # Add margins for better appearance and ensure full visibility
             ax.margins(x=0.01, y=0.02)
-            
-            # Improve subplot spacing to prevent overlap
-            if i < n_groups - 1:  # Not the last subplot
-                ax.tick_params(labelbottom=False)  # Hide x-axis labels except for bottom
         
         # Add modern overall title
         if session_name:
+            # No explicit y: the figure's constrained layout places the title
             self.figure.suptitle(f'🚁 {session_name} - Detailed Analysis', 
-                               fontsize=14, fontweight='600', y=0.98, color='#1e293b')
-        
-        # Better layout with improved spacing to prevent overlap
-        self.figure.tight_layout(rect=[0, 0.02, 1, 0.96], h_pad=2.5, w_pad=1.0)
-        
-        # Format time axis
-        self.figure.autofmt_xdate()
-        
-        # Force a redraw to ensure proper sizing
-        self.figure.canvas.draw_idle()
+                               fontsize=14, fontweight='600', color='#1e293b')
     
     def _create_empty_state(self):
         """Create modern empty state visualization"""
@@ -357,66 +492,120 @@ class PlotManager:
         ax.set_facecolor('#fafafa')
     
     def _plot_data_series_modern(self, ax, data_info: Dict[str, Any], color: str, alpha: float = 0.8):
-        """Plot a single data series with modern styling"""
-        timestamps = data_info['timestamp']
-        values = data_info['data']
-        label = data_info['label']
+        """Plot a single data series with modern styling; returns its Line2D (None if skipped)"""
+        series = self._series_arrays(ax, data_info)
+        if series is None:
+            # Skip non-numeric string data
+            return None
+        timestamps, values = series
         
-        # Handle different data types
-        if isinstance(values[0], str):
-            # Convert string data to numeric if possible
-            try:
-                values = [float(v) if v != 'manual' else 0 for v in values]
-            except (ValueError, TypeError):
-                # Skip non-numeric string data
-                return
+        # Plot the data with modern styling
+        line = ax.plot(timestamps, values, label=data_info['label'], color=color, 
+                      alpha=alpha, solid_capstyle='round',
+                      zorder=3)  # Higher z-order for better visibility
+        line[0].set_antialiased(True)
+        self._style_line(line[0], len(data_info['timestamp']), alpha, color)
+        return line[0]
+    
+    @staticmethod
+    def _setup_time_axis(ax):
+        """Numeric (date2num) x axis with concise date ticks"""
+        ax.xaxis_date()
+        # With sharex this Ticker is shared by every axes in the group, so call
+        # it once per group rather than once per axes
+        locator = mdates.AutoDateLocator()
+        ax.xaxis.set_major_locator(locator)
+        ax.xaxis.set_major_formatter(mdates.ConciseDateFormatter(locator))
+    
+    def _series_arrays(self, ax, data_info: Dict[str, Any]):
+        """(timestamps, values) ready to draw on `ax`, or None for non-numeric data"""
+        # Matplotlib date numbers, converted once per data_info and cached on it
+        timestamps = data_info.get('timestamp_num')
+        if timestamps is None:
+            timestamps = data_info['timestamp_num'] = mdates.date2num(data_info['timestamp'])
         
-        # Enhanced line styling based on data density and alpha
+        # Handle different data types
+        values = self._prepare_series(data_info['data'], data_info.get('is_string', False))
+        if values is None:
+            return None
+        
+        # Dense series: draw only each pixel column's extremes
+        if DOWNSAMPLE and not self._high_fidelity and values.dtype.kind == 'f':
+            n_buckets = max(int(ax.figure.get_size_inches()[0] * ax.figure.dpi),
+                            MIN_DOWNSAMPLE_BUCKETS)
+            if len(values) > 4 * n_buckets:
+                timestamps, values = minmax_downsample(timestamps, values, n_buckets)
+        return timestamps, values
+    
+    @staticmethod
+    def _style_line(line, n_points: int, alpha: float, color: str):
+        """Line width and markers based on data density and alpha"""
         if alpha >= 1.0:  # For separate plots - use thicker, more visible lines
-            line_width = 3.0 if len(timestamps) > 1000 else 3.5
-            marker_size = 6 if len(timestamps) < 100 else 0
+            line_width = 3.0 if n_points > 1000 else 3.5
+            marker_size = 6 if n_points < 100 else 0
         else:  # For combined plots
-            line_width = 2.5 if len(timestamps) > 1000 else 2.8
-            marker_size = 5 if len(timestamps) < 100 else 0
-        
-        # Plot the data with modern styling
-        line = ax.plot(timestamps, values, label=label, color=color, 
-                      alpha=alpha, linewidth=line_width, solid_capstyle='round',
-                      zorder=3)  # Higher z-order for better visibility
+            line_width = 2.5 if n_points > 1000 else 2.8
+            marker_size = 5 if n_points < 100 else 0
+        line.set_linewidth(line_width)
         
         # Add modern markers for sparse data
         if marker_size > 0:
-            line[0].set_marker('o')
-            line[0].set_markersize(marker_size)
-            line[0].set_markerfacecolor(color)
-            line[0].set_markeredgecolor('white')
-            line[0].set_markeredgewidth(1.5 if alpha >= 1.0 else 1)
-            line[0].set_zorder(4)  # Markers on top
-    
-    def _get_group_ylabel(self, group_name: str, group_data: Dict[str, Dict[str, Any]]) -> str:
-        """Get appropriate ylabel for a data group"""
-        # Modern unit formatting
-        common_units = {
-            'Depth & Pressure': 'Depth (m) • Pressure (mbar)',
-            'Temperature': 'Temperature (°C)',
-            'Orientation': 'Angle (degrees)',
-            'Voltage & Current': 'Voltage (V) • Current (A)',
-            'Motor Data': 'PWM Value',
-            'Sonar & Distance': 'Distance (m) • Confidence (%)',
-            'Other': 'Value'
-        }
+            line.set_marker('o')
+            line.set_markersize(marker_size)
+            line.set_markerfacecolor(color)
+            line.set_markeredgecolor('white')
+            line.set_markeredgewidth(1.5 if alpha >= 1.0 else 1)
+            line.set_zorder(4)  # Markers on top
+        else:
+            line.set_marker('None')
+            line.set_zorder(3)
+    
+    @staticmethod
+    def _prepare_series(arr: np.ndarray, is_string: bool = False) -> Optional[np.ndarray]:
+        """Convert a series to a float64 array in one pass ('manual' → 0); None if non-numeric"""
+        if arr.dtype.kind in 'biuf':
+            return arr.astype(np.float64, copy=False)
+        if arr.size == 0:
+            return arr
+        
+        if is_string:
+            # Convert string data to numeric if possible
+            try:
+                return np.where(arr == 'manual', 0, arr).astype(np.float64)
+            except (ValueError, TypeError):
+                return None
         
-        return common_units.get(group_name, 'Value')
+        # Mixed/object numbers: convert if clean, otherwise let matplotlib handle them
+        try:
+            return arr.astype(np.float64)
+        except (ValueError, TypeError):
+            return arr
+    
+    @staticmethod
+    def _get_group_ylabel(group_name: str) -> str:
+        """Get appropriate ylabel for a data group"""
+        return _GROUP_YLABELS.get(group_name, 'Value')
     
     def add_time_markers(self, ax, events: List[Tuple[datetime, str]]):
         """Add modern vertical lines for important events"""
-        for event_time, event_label in events:
-            # Modern event line styling
-            ax.axvline(x=event_time, color='#ef4444', linestyle='--', 
-                      alpha=0.8, linewidth=2)
-            
-            # Modern event label
-            ax.text(event_time, ax.get_ylim()[1] * 0.95, event_label, 
+        if not events:
+            return
+        from matplotlib.collections import LineCollection
+        
+        event_xs = mdates.date2num([event_time for event_time, _ in events])
+        
+        # Modern event line styling: one collection spanning the axes height
+        # (x in data, y in axes coordinates, like axvline)
+        segments = [((x, 0), (x, 1)) for x in event_xs]
+        ax.add_collection(LineCollection(segments, transform=ax.get_xaxis_transform(),
+                                         colors='#ef4444', linestyles='--',
+                                         alpha=0.8, linewidths=2),
+                          autolim=False)
+        
+        # Modern event labels
+        label_y = ax.get_ylim()[1] * 0.95
+        for event_x, (_, event_label) in zip(event_xs, events):
+            ax.text(event_x, label_y, event_label, 
                    rotation=90, verticalalignment='top', fontsize=9,
                    color='#ef4444', fontweight='500',
                    bbox=dict(boxstyle='round,pad=0.3', facecolor='white', 
@@ -433,8 +622,16 @@ class PlotManager:
             print(f"Error exporting plot: {e}")
             return False
     
-    def get_plot_statistics(self, data: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
-        """Get statistics about the plotted data"""
+    @staticmethod
+    def _to_datetime(value) -> datetime:
+        """Turn a numpy datetime64 (as sliced from the DataFrames) into a datetime"""
+        if isinstance(value, np.datetime64):
+            return value.astype('datetime64[us]').item()
+        return value
+    
+    @staticmethod
+    def get_plot_statistics(data: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """Get statistics about the plotted data (needs no figure)"""
         stats = {
             'total_series': len(data),
             'time_range': None,
@@ -445,26 +642,43 @@ class PlotManager:
         if not data:
             return stats
         
-        # Calculate overall statistics
-        all_timestamps = []
+        # Calculate overall statistics; each series contributes only its own
+        # min/max timestamp instead of being concatenated into one list
+        time_min = time_max = None
         total_points = 0
         
         for data_key, data_info in data.items():
             timestamps = data_info['timestamp']
             values = data_info['data']
             
-            all_timestamps.extend(timestamps)
             total_points += len(timestamps)
+            if len(timestamps):
+                series_min, series_max = timestamps.min(), timestamps.max()
+                if time_min is None or series_min < time_min:
+                    time_min = series_min
+                if time_max is None or series_max > time_max:
+                    time_max = series_max
             
             # Per-series statistics
             try:
-                numeric_values = [float(v) for v in values if isinstance(v, (int, float))]
-                if numeric_values:
+                if values.dtype.kind in 'biuf':
+                    numeric_values = values.astype(np.float64, copy=False)
+                elif data_info.get('is_string', False):
+                    numeric_values = np.empty(0)
+                else:
+                    # Object/string series: only the numeric entries count
+                    is_numeric = np.fromiter((isinstance(v, (int, float)) for v in values),
+                                             dtype=bool, count=len(values))
+                    numeric_values = values[is_numeric].astype(np.float64)
+                # Missing samples load as NaN; they must not poison the reductions
+                # (an all-NaN series ends up empty and is skipped)
+                numeric_values = numeric_values[~np.isnan(numeric_values)]
+                if numeric_values.size:
                     stats['series_info'][data_key] = {
                         'points': len(timestamps),
-                        'min_value': min(numeric_values),
-                        'max_value': max(numeric_values),
-                        'mean_value': sum(numeric_values) / len(numeric_values)
+                        'min_value': float(numeric_values.min()),
+                        'max_value': float(numeric_values.max()),
+                        'mean_value': float(numeric_values.mean())
                     }
             except (ValueError, TypeError):
                 stats['series_info'][data_key] = {
@@ -472,8 +686,8 @@ class PlotManager:
                     'data_type': 'non-numeric'
                 }
         
-        if all_timestamps:
-            stats['time_range'] = (min(all_timestamps), max(all_timestamps))
+        if time_min is not None:
+            stats['time_range'] = (PlotManager._to_datetime(time_min), PlotManager._to_datetime(time_max))
             stats['data_points'] = total_points
         
         return stats
\ No newline at end of file
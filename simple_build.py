@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """
-Simple One-File Build Script for Drone Log Analyzer
-Creates a single executable file with minimal dependencies
+Simple Build Script for Drone Log Analyzer
+Creates an executable folder (plus a zip of it) with minimal dependencies
 """
 
 import subprocess
@@ -10,6 +10,10 @@ import os
 import shutil
 from pathlib import Path
 
+# --onedir output: the app folder and the executable inside it
+APP_DIR = Path("dist/DroneLogAnalyzer")
+EXECUTABLE = APP_DIR / ("DroneLogAnalyzer.exe" if sys.platform.startswith("win") else "DroneLogAnalyzer")
+
 def clean_build():
     """Clean previous builds"""
     print("🧹 Cleaning previous builds...")
@@ -27,11 +31,12 @@ def clean_build():
 
 def build_simple():
     """Build with simple PyInstaller command"""
-    print("🚀 Building single executable...")
+    print("🚀 Building executable...")
     
     cmd = [
         "pyinstaller",
-        "--onefile",           # Single file
+        "--onedir",            # No per-launch unpacking to a temp dir (unlike --onefile)
+        "--noupx",             # UPX-compressed binaries decompress on every start
         "--windowed",          # No console (GUI mode)
         "--name", "DroneLogAnalyzer",
         "--clean",
@@ -82,9 +87,9 @@ def build_simple():
     if result.returncode == 0:
         print("✅ Build successful!")
         
-        executable = Path("dist/DroneLogAnalyzer")
+        executable = EXECUTABLE
         if executable.exists():
-            size_mb = executable.stat().st_size / (1024 * 1024)
+            size_mb = sum(f.stat().st_size for f in APP_DIR.rglob("*") if f.is_file()) / (1024 * 1024)
             print(f"📦 Executable: {executable.absolute()}")
             print(f"📏 Size: {size_mb:.1f} MB")
             
@@ -92,6 +97,10 @@ def build_simple():
             executable.chmod(0o755)
             print("✅ Made executable")
             
+            # Single-artifact deliverable: zip the app folder
+            archive = shutil.make_archive(str(APP_DIR), "zip", root_dir="dist", base_dir=APP_DIR.name)
+            print(f"🗜️  Archive: {Path(archive).absolute()}")
+            
             return True
         else:
             print("❌ Executable not found")
@@ -103,7 +112,7 @@ def build_simple():
 
 def test_executable():
     """Test if executable works"""
-    executable = Path("dist/DroneLogAnalyzer")
+    executable = EXECUTABLE
     if executable.exists():
         print("🧪 Testing executable...")
         print("   Run this to test:")
@@ -130,7 +139,7 @@ def main():
             test_executable()
             print()
             print("🎉 Build completed!")
-            print("📁 Find your executable in: dist/DroneLogAnalyzer")
+            print(f"📁 Find your executable in: {APP_DIR}/ (zipped as {APP_DIR}.zip)")
         else:
             print("❌ Build failed")
             sys.exit(1)